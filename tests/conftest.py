@@ -363,6 +363,7 @@ class MockHTTPResponse:
     def __init__(self, status_code: int, json_data: Dict[str, Any]):
         self.status_code = status_code
         self._json_data = json_data
+        self.text = json.dumps(json_data)
     
     def json(self):
         """Return JSON data."""
@@ -6,14 +6,22 @@ Includes detailed logging and comprehensive assertions.
 """
 
 import pytest
+import asyncio
+import json
 import logging
+import weakref
 from unittest.mock import Mock, AsyncMock, patch
 
 from zapi_async import ZAPIClient
+from zapi_async import api as api_module
+from zapi_async.api import GraphAPI
 from zapi_async.types import SentMessage, InstanceStatus, QRCode
+from zapi_async.transport import AsyncTransport, BufferedResponse
 from zapi_async.errors import (
     ZAPIError,
     AuthenticationError,
+    InstanceError,
+    RateLimitError,
     ValidationError,
 )
 
@@ -56,6 +64,32 @@ class TestClientInitialization:
         assert test_config["instance_id"] in repr_str
         
         logger.info(f"✅ Client repr: {repr_str}")
+    
+    def test_default_session_headers(self, test_config):
+        """Test that the default session carries the static headers."""
+        logger.info("🧪 Testing default session headers")
+        
+        client = ZAPIClient(**test_config)
+        
+        session_headers = client.api._session.headers
+        assert session_headers["client-token"] == test_config["client_token"]
+        assert session_headers["content-type"] == "application/json"
+        assert client.api._build_headers() is None
+        assert client.api._build_headers({"X-Test": "1"})["x-test"] == "1"
+        
+        logger.info("✅ Headers set on session")
+    
+    def test_client_supports_weakref_and_patching(self, test_config):
+        """Test that clients can be weakly referenced and patched per instance."""
+        logger.info("🧪 Testing weakref and instance patching")
+        
+        client = ZAPIClient(**test_config)
+        
+        assert weakref.ref(client)() is client
+        with patch.object(client, "send_text", AsyncMock()) as mocked:
+            assert client.send_text is mocked
+        
+        logger.info("✅ Client is weakref-able and patchable")
 
 
 @pytest.mark.unit
@@ -131,6 +165,18 @@ class TestInstanceManagement:
         mock_client.api.post.assert_called_once_with("disconnect")
         
         logger.info("✅ Disconnect successful")
+    
+    async def test_warmup_ignores_http_errors(self, mock_client):
+        """Test that warmup tolerates HTTP error responses."""
+        logger.info("🧪 Testing warmup")
+        
+        mock_client.api.get = AsyncMock(side_effect=AuthenticationError("bad token", status_code=401))
+        
+        await mock_client.warmup()
+        
+        mock_client.api.get.assert_called_once_with("status", log_request=False)
+        
+        logger.info("✅ Warmup completed")
 
 
 @pytest.mark.unit
@@ -258,6 +304,23 @@ class TestTextMessaging:
             assert formatted_phone.isdigit()
         
         logger.info("✅ All phone formats handled correctly")
+    
+    async def test_send_text_raw(
+        self,
+        mock_client,
+        test_phone,
+        mock_sent_message_response
+    ):
+        """Test that raw=True returns the response dict unchanged."""
+        logger.info("🧪 Testing send_text (raw)")
+        
+        mock_client.api.post = AsyncMock(return_value=mock_sent_message_response)
+        
+        result = await mock_client.send_text(phone=test_phone, message="Hi", raw=True)
+        
+        assert result is mock_sent_message_response
+        
+        logger.info("✅ Raw response returned")
 
 
 @pytest.mark.unit
@@ -613,6 +676,508 @@ class TestReactions:
         logger.info("✅ Reaction removed successfully")
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkSending:
+    """Test bulk sending helpers."""
+    
+    async def test_send_many(self, mock_client, mock_sent_message_response):
+        """Test sending several messages concurrently."""
+        logger.info("🧪 Testing send_many")
+        
+        mock_client.api.post = AsyncMock(return_value=mock_sent_message_response)
+        
+        results = await mock_client.send_many([
+            {"phone": "+55 11 99999-9999", "message": "One"},
+            {"phone": "5511888888888", "message": "Two", "delayMessage": None},
+        ], concurrency=2)
+        
+        assert len(results) == 2
+        assert all(isinstance(r, SentMessage) for r in results)
+        assert mock_client.api.post.call_count == 2
+        
+        bodies = [call.kwargs["json"] for call in mock_client.api.post.call_args_list]
+        assert {"phone": "5511999999999", "message": "One"} in bodies
+        assert {"phone": "5511888888888", "message": "Two"} in bodies
+        
+        logger.info("✅ Bulk send successful")
+    
+    async def test_send_many_encodes_media_files(
+        self,
+        mock_client,
+        mock_sent_message_response,
+        tmp_path
+    ):
+        """Test that media file paths in bulk items are encoded."""
+        logger.info("🧪 Testing send_many (media files)")
+        
+        mock_client.api.post = AsyncMock(return_value=mock_sent_message_response)
+        file_path = tmp_path / "photo.jpg"
+        file_path.write_bytes(b"jpeg-bytes")
+        item = {"phone": "5511999999999", "image": file_path}
+        
+        await mock_client.send_many([item], endpoint="send-image")
+        
+        body = mock_client.api.post.call_args.kwargs["json"]
+        assert body["image"].startswith("data:image/jpeg;base64,")
+        assert item["image"] is file_path  # caller's dict untouched
+        
+        logger.info("✅ Media encoded in bulk send")
+    
+    async def test_send_many_returns_exceptions(self, mock_client, mock_sent_message_response):
+        """Test that a failed send is returned instead of raised."""
+        logger.info("🧪 Testing send_many (partial failure)")
+        
+        mock_client.api.post = AsyncMock(
+            side_effect=[mock_sent_message_response, RateLimitError("slow down", status_code=429)]
+        )
+        
+        results = await mock_client.send_many(
+            [{"phone": "5511999999999", "message": "A"}, {"phone": "5511888888888", "message": "B"}],
+            concurrency=1,
+        )
+        
+        assert isinstance(results[0], SentMessage)
+        assert isinstance(results[1], RateLimitError)
+        
+        logger.info("✅ Partial failure reported")
+    
+    async def test_send_stream(self, mock_client, mock_sent_message_response):
+        """Test streaming sends with bounded concurrency."""
+        logger.info("🧪 Testing send_stream")
+        
+        in_flight = 0
+        peak = 0
+        
+        async def post(endpoint, json=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock_sent_message_response
+        
+        mock_client.api.post = AsyncMock(side_effect=post)
+        
+        async def rows():
+            for i in range(20):
+                yield {"phone": f"+55 11 9{i:04d}-0000", "message": f"Msg {i}", "delayMessage": None}
+        
+        sent = await mock_client.send_stream(rows(), concurrency=3)
+        
+        assert sent == 20
+        assert peak <= 3
+        body = mock_client.api.post.call_args_list[0].kwargs["json"]
+        assert body["phone"].isdigit()
+        assert "delayMessage" not in body
+        
+        logger.info(f"✅ Streamed {sent} messages (peak {peak} in flight)")
+    
+    async def test_send_stream_propagates_errors(self, mock_client, mock_sent_message_response):
+        """Test that the first failure stops the stream."""
+        logger.info("🧪 Testing send_stream (error)")
+        
+        mock_client.api.post = AsyncMock(
+            side_effect=[mock_sent_message_response, RateLimitError("slow down", status_code=429)]
+        )
+        bodies = ({"phone": "5511999999999", "message": str(i)} for i in range(1000))
+        
+        with pytest.raises(RateLimitError):
+            await mock_client.send_stream(bodies, concurrency=1)
+        
+        assert mock_client.api.post.call_count == 2
+        
+        logger.info("✅ Stream stopped on error")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGroups:
+    """Test group management methods."""
+    
+    async def test_create_group_large_phone_list(self, mock_client):
+        """Test that large phone lists are formatted correctly."""
+        logger.info("🧪 Testing create_group (large phone list)")
+        
+        mock_client.api.post = AsyncMock(return_value={"phone": "120363019502650977-group"})
+        phones = [f"+55 11 9{i:04d}-0000" for i in range(300)]
+        
+        await mock_client.create_group("Big group", phones)
+        
+        body = mock_client.api.post.call_args.kwargs["json"]
+        assert len(body["phones"]) == 300
+        assert body["phones"][0] == "5511900000000"
+        assert all(p.isdigit() for p in body["phones"])
+        
+        logger.info("✅ Large group created")
+    
+    async def test_update_group_settings_omits_unset(self, mock_client, test_group_id):
+        """Test that only the given settings are sent."""
+        logger.info("🧪 Testing update_group_settings")
+        
+        mock_client.api.post = AsyncMock(return_value={"value": True})
+        
+        await mock_client.update_group_settings(test_group_id, only_admins_can_edit_info=False)
+        
+        body = mock_client.api.post.call_args.kwargs["json"]
+        assert body == {"groupId": test_group_id, "onlyAdminsCanEditInfo": False}
+        
+        logger.info("✅ Unset settings omitted")
+    
+    async def test_update_group_settings_noop(self, mock_client, test_group_id):
+        """Test that no request is made when no setting is given."""
+        logger.info("🧪 Testing update_group_settings (no-op)")
+        
+        mock_client.api.post = AsyncMock(return_value={"value": True})
+        
+        assert await mock_client.update_group_settings(test_group_id) == {}
+        assert await mock_client.update_groups_settings(["g1", "g2"]) == [{}, {}]
+        mock_client.api.post.assert_not_called()
+        
+        logger.info("✅ No-op skipped the request")
+    
+    async def test_get_group_metadata_without_participants(self, mock_client, test_group_id):
+        """Test skipping participant parsing for metadata-only lookups."""
+        logger.info("🧪 Testing get_group_metadata (include_participants=False)")
+        
+        response = {
+            "id": test_group_id,
+            "subject": "Team",
+            "participants": [{"phone": "5511999999999", "isAdmin": True}, {"phone": "5511888888888"}],
+        }
+        mock_client.api.post = AsyncMock(return_value=response)
+        
+        full = await mock_client.get_group_metadata(test_group_id)
+        light = await mock_client.get_group_metadata(test_group_id, include_participants=False)
+        
+        assert full.participants[0].is_admin is True
+        assert full.size == light.size == 2
+        assert light.participants == []
+        assert light.subject == "Team"
+        
+        logger.info("✅ Participants skipped")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkGroupAdmin:
+    """Test bulk group administration helpers."""
+    
+    async def test_add_participants(self, mock_client, test_group_id):
+        """Test adding several participants concurrently."""
+        logger.info("🧪 Testing add_participants")
+        
+        mock_client.api.post = AsyncMock(return_value={"value": True})
+        
+        results = await mock_client.add_participants(
+            test_group_id,
+            ["+55 11 99999-9999", 5511888888888],
+            auto_invite=False,
+        )
+        
+        assert results == [{"value": True}, {"value": True}]
+        bodies = [call.kwargs["json"] for call in mock_client.api.post.call_args_list]
+        assert {"groupId": test_group_id, "phone": "5511999999999", "autoInvite": False} in bodies
+        assert {"groupId": test_group_id, "phone": "5511888888888", "autoInvite": False} in bodies
+        assert all(call.args[0] == "add-participant" for call in mock_client.api.post.call_args_list)
+        
+        logger.info("✅ Participants added")
+    
+    async def test_demote_admins_invalid_phone(self, mock_client, test_group_id):
+        """Test that invalid phones fail before any request is made."""
+        logger.info("🧪 Testing demote_admins (invalid phone)")
+        
+        mock_client.api.post = AsyncMock(return_value={"value": True})
+        
+        with pytest.raises(ValidationError):
+            await mock_client.demote_admins(test_group_id, ["5511999999999", "123"])
+        
+        mock_client.api.post.assert_not_called()
+        
+        logger.info("✅ Invalid phone rejected up front")
+    
+    async def test_update_groups_settings(self, mock_client):
+        """Test applying settings to several groups concurrently."""
+        logger.info("🧪 Testing update_groups_settings")
+        
+        mock_client.api.post = AsyncMock(return_value={"value": True})
+        
+        results = await mock_client.update_groups_settings(["g1", "g2"], only_admins_can_send=True)
+        
+        assert results == [{"value": True}, {"value": True}]
+        bodies = [call.kwargs["json"] for call in mock_client.api.post.call_args_list]
+        assert {"groupId": "g1", "onlyAdminsCanSend": True} in bodies
+        assert {"groupId": "g2", "onlyAdminsCanSend": True} in bodies
+        
+        logger.info("✅ Settings applied to all groups")
+    
+    async def test_get_group_invite_links(self, mock_client):
+        """Test fetching several invite links with per-group failures."""
+        logger.info("🧪 Testing get_group_invite_links")
+        
+        mock_client.api.post = AsyncMock(
+            side_effect=[
+                {"inviteLink": "https://chat.whatsapp.com/ABC"},
+                InstanceError("not found", status_code=404),
+            ]
+        )
+        
+        results = await mock_client.get_group_invite_links(["g1", "g2"], concurrency=1)
+        
+        assert results[0].invite_link == "https://chat.whatsapp.com/ABC"
+        assert isinstance(results[1], InstanceError)
+        
+        logger.info("✅ Invite links fetched")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestErrorHandling:
+    """Test HTTP error mapping in GraphAPI."""
+    
+    async def test_status_codes_map_to_exceptions(self, mock_graph_api, create_mock_response):
+        """Test that known status codes raise the matching exception type."""
+        logger.info("🧪 Testing _handle_error status mapping")
+        
+        cases = [
+            (401, AuthenticationError),
+            (403, AuthenticationError),
+            (404, InstanceError),
+            (405, ValidationError),
+            (415, ValidationError),
+            (429, RateLimitError),
+            (503, ZAPIError),
+            (418, ZAPIError),
+        ]
+        
+        for status_code, exc_type in cases:
+            response = create_mock_response(status_code, {"message": "boom"})
+            with pytest.raises(exc_type) as exc_info:
+                await mock_graph_api._handle_error(response)
+            assert exc_info.value.status_code == status_code
+            logger.debug(f"{status_code} → {exc_info.value}")
+        
+        logger.info("✅ Status codes mapped correctly")
+    
+    async def test_error_message_included(self, mock_graph_api, create_mock_response):
+        """Test that the response message is included in the exception."""
+        logger.info("🧪 Testing _handle_error message extraction")
+        
+        response = create_mock_response(429, {"error": "slow down"})
+        with pytest.raises(RateLimitError) as exc_info:
+            await mock_graph_api._handle_error(response)
+        
+        assert exc_info.value.message == "Rate limit exceeded: slow down"
+        assert exc_info.value.response_data == {"error": "slow down"}
+        
+        logger.info("✅ Error message extracted correctly")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBoundedConcurrency:
+    """Test GraphAPI.iter_bounded."""
+    
+    async def test_iter_bounded_respects_limit(self, mock_graph_api):
+        """Test that no more than `limit` awaitables run at once."""
+        logger.info("🧪 Testing iter_bounded (concurrency limit)")
+        
+        running = 0
+        peak = 0
+        
+        async def job(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return i
+        
+        results = [r async for r in mock_graph_api.iter_bounded((job(i) for i in range(20)), limit=4)]
+        
+        assert sorted(results) == list(range(20))
+        assert peak <= 4
+        
+        logger.info(f"✅ Peak concurrency: {peak}")
+    
+    async def test_iter_bounded_propagates_errors(self, mock_graph_api):
+        """Test that errors from awaitables are re-raised."""
+        logger.info("🧪 Testing iter_bounded (error propagation)")
+        
+        async def fail():
+            raise ZAPIError("boom")
+        
+        with pytest.raises(ZAPIError):
+            async for _ in mock_graph_api.iter_bounded([fail()], limit=2):
+                pass
+        
+        logger.info("✅ Error propagated")
+    
+    async def test_iter_bounded_propagates_cancellation(self, mock_graph_api):
+        """Test that a CancelledError from an awaitable doesn't hang the consumer."""
+        logger.info("🧪 Testing iter_bounded (cancelled awaitable)")
+        
+        async def ok(value):
+            return value
+        
+        async def cancelled():
+            future = asyncio.get_running_loop().create_future()
+            future.cancel()
+            return await future
+        
+        async def consume():
+            calls = [ok(1), cancelled(), ok(2)]
+            return [r async for r in mock_graph_api.iter_bounded(calls, limit=2)]
+        
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(consume(), timeout=1)
+        
+        logger.info("✅ Cancellation propagated")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCustomTransport:
+    """Test pluggable transports."""
+    
+    async def test_custom_transport(self, test_config):
+        """Test that any object implementing AsyncTransport can back the client."""
+        logger.info("🧪 Testing custom transport")
+        
+        class FakeTransport:
+            def __init__(self):
+                self.calls = []
+                self.closed = False
+            
+            async def request(self, method, url, *, json=None, params=None, headers=None, content=None):
+                self.calls.append((method, url, json))
+                return BufferedResponse(200, b'{"zaapId": "Z", "messageId": "M", "id": "M"}')
+            
+            async def aclose(self):
+                self.closed = True
+        
+        transport = FakeTransport()
+        assert isinstance(transport, AsyncTransport)
+        
+        async with ZAPIClient(**test_config, session=transport) as client:
+            result = await client.send_text("5511999999999", "Hi")
+        
+        assert result.message_id == "M"
+        assert transport.calls[0][0] == "POST"
+        assert transport.calls[0][1].endswith("/send-text")
+        assert transport.closed is True
+        
+        logger.info("✅ Custom transport used")
+    
+    async def test_post_binary(self, test_config):
+        """Test that post_binary sends the raw body with its content type."""
+        logger.info("🧪 Testing post_binary")
+        
+        session = AsyncMock()
+        session.request.return_value = BufferedResponse(200, b'{"ok": true}')
+        api = GraphAPI(**test_config, session=session)
+        
+        result = await api.post_binary("upload", b"\x89PNG", "image/png", {"phone": "5511999999999"})
+        
+        assert result == {"ok": True}
+        kwargs = session.request.call_args.kwargs
+        assert kwargs["content"] == b"\x89PNG"
+        assert kwargs["json"] is None
+        assert kwargs["headers"]["content-type"] == "image/png"
+        assert kwargs["params"] == {"phone": "5511999999999"}
+        
+        logger.info("✅ Binary body sent")
+    
+    async def test_json_body_serialized_once(self, test_config):
+        """Test that JSON bodies reach the transport pre-serialized by orjson."""
+        logger.info("🧪 Testing JSON body serialization")
+        
+        if api_module.orjson is None:
+            pytest.skip("orjson not installed")
+        
+        session = AsyncMock()
+        session.request.return_value = BufferedResponse(200, b'{}')
+        api = GraphAPI(**test_config, session=session)
+        
+        await api.post("send-text", json={"phone": "5511999999999", "message": "Olá"})
+        
+        kwargs = session.request.call_args.kwargs
+        assert kwargs["json"] is None
+        assert isinstance(kwargs["content"], bytes)
+        assert json.loads(kwargs["content"]) == {"phone": "5511999999999", "message": "Olá"}
+        
+        logger.info("✅ JSON body serialized")
+
+
+@pytest.mark.unit
+class TestAiohttpTransport:
+    """Test AiohttpTransport against a local aiohttp server."""
+    
+    def test_roundtrip(self, test_config, monkeypatch):
+        """Test that a synchronously built transport sends JSON, params and binary bodies."""
+        logger.info("🧪 Testing AiohttpTransport round-trips")
+        
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        from zapi_async.transport import AiohttpTransport
+        
+        # Built outside any event loop, like module-level or sync setup code
+        transport = AiohttpTransport()
+        seen = []
+        
+        async def handler(request):
+            seen.append((
+                request.method,
+                request.path,
+                dict(request.query),
+                request.headers.get("Content-Type"),
+                request.headers.get("Client-Token"),
+                await request.read(),
+            ))
+            return web.json_response({"ok": True, "path": request.path})
+        
+        async def roundtrip():
+            app = web.Application()
+            app.router.add_route("*", "/{tail:.*}", handler)
+            async with TestServer(app) as server:
+                monkeypatch.setattr(GraphAPI, "BASE_URL", str(server.make_url("")).rstrip("/"))
+                async with GraphAPI(**test_config, session=transport) as api:
+                    posted = await api.post(
+                        "send-text", json={"phone": "5511999999999", "message": "Olá"}
+                    )
+                    fetched = await api.get("status", params={"full": "1"})
+                    uploaded = await api.post_binary(
+                        "upload", b"\x89PNG", "image/png", {"phone": "5511999999999"}
+                    )
+            return posted, fetched, uploaded
+        
+        posted, fetched, uploaded = asyncio.run(roundtrip())
+        
+        prefix = f"/instances/{test_config['instance_id']}/token/{test_config['token']}"
+        assert posted == {"ok": True, "path": f"{prefix}/send-text"}
+        assert fetched["path"] == f"{prefix}/status"
+        assert uploaded["path"] == f"{prefix}/upload"
+        
+        method, path, query, content_type, client_token, body = seen[0]
+        assert (method, path, query) == ("POST", f"{prefix}/send-text", {})
+        assert content_type == "application/json"
+        assert client_token == test_config["client_token"]
+        assert json.loads(body) == {"phone": "5511999999999", "message": "Olá"}
+        
+        method, path, query, content_type, client_token, body = seen[1]
+        assert (method, query, body) == ("GET", {"full": "1"}, b"")
+        assert client_token == test_config["client_token"]
+        
+        method, path, query, content_type, client_token, body = seen[2]
+        assert (method, query) == ("POST", {"phone": "5511999999999"})
+        assert content_type == "image/png"
+        assert client_token == test_config["client_token"]
+        assert body == b"\x89PNG"
+        
+        logger.info("✅ AiohttpTransport round-trips")
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestClientCleanup:
@@ -1,10 +1,11 @@
 """
 Unit tests for helper functions.
 
-Tests all utility functions in _helpers.py.
+Tests all utility functions in _helpers.py and utils.py.
 """
 
 import pytest
+import base64
 import logging
 from pathlib import Path
 
@@ -14,11 +15,15 @@ from zapi_async._helpers import (
     is_base64,
     is_group_id,
     encode_base64,
+    encode_base64_async,
+    resolve_media,
     get_mime_type,
     format_text_markdown,
     build_request_body,
+    _B64_CACHE_MAX_FILE_SIZE,
 )
 from zapi_async.errors import ValidationError
+from zapi_async.utils import Version, ensure_list, remove_none_values, setup_logging
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +76,16 @@ class TestPhoneFormatting:
         
         logger.info("✅ Clean phone passed through")
     
+    def test_format_phone_non_ascii_digits(self):
+        """Test that non-ASCII digit characters are not passed through."""
+        logger.info("🧪 Testing format_phone with non-ASCII digits")
+        
+        result = format_phone("5511999999999²")
+        
+        assert result == "5511999999999"
+        
+        logger.info("✅ Non-ASCII digits stripped")
+    
     def test_format_phone_with_country_code(self):
         """Test various country codes."""
         logger.info("🧪 Testing format_phone with country codes")
@@ -160,6 +175,87 @@ class TestBase64Detection:
         logger.info("✅ Non-base64 strings rejected correctly")
 
 
+@pytest.mark.unit
+class TestBase64Encoding:
+    """Test file encoding to base64 data URIs."""
+    
+    def test_encode_base64_large_file(self, tmp_path):
+        """Test that chunked encoding matches a one-shot encode."""
+        logger.info("🧪 Testing encode_base64 (multi-chunk file)")
+        
+        data = bytes(range(256)) * 2000  # spans several read chunks
+        file_path = tmp_path / "image.png"
+        file_path.write_bytes(data)
+        
+        result = encode_base64(file_path)
+        
+        assert result == "data:image/png;base64," + base64.b64encode(data).decode()
+        
+        logger.info("✅ Chunked encoding matches")
+    
+    def test_encode_base64_missing_file(self, tmp_path):
+        """Test encoding a missing file."""
+        logger.info("🧪 Testing encode_base64 (missing file)")
+        
+        with pytest.raises(ValidationError):
+            encode_base64(tmp_path / "missing.png")
+        
+        logger.info("✅ Missing file rejected")
+    
+    async def test_encode_base64_async(self, tmp_path):
+        """Test async encoding matches sync encoding."""
+        logger.info("🧪 Testing encode_base64_async")
+        
+        file_path = tmp_path / "doc.pdf"
+        file_path.write_bytes(b"%PDF-1.4 test")
+        
+        assert await encode_base64_async(file_path) == encode_base64(file_path)
+        
+        logger.info("✅ Async encoding matches")
+    
+    async def test_encode_base64_async_cache(self, tmp_path):
+        """Test that unchanged files are encoded once and edits are picked up."""
+        logger.info("🧪 Testing encode_base64_async cache")
+        
+        file_path = tmp_path / "group.jpg"
+        file_path.write_bytes(b"photo-v1")
+        
+        first = await encode_base64_async(file_path)
+        assert await encode_base64_async(str(file_path)) is first
+        
+        file_path.write_bytes(b"photo-v2-edited")
+        assert await encode_base64_async(file_path) == encode_base64(file_path) != first
+        
+        with pytest.raises(ValidationError):
+            await encode_base64_async(tmp_path / "missing.jpg")
+        
+        # Files above the threshold are never retained
+        big_path = tmp_path / "video.mp4"
+        big_path.write_bytes(b"\0" * (_B64_CACHE_MAX_FILE_SIZE + 1))
+        assert await encode_base64_async(big_path) is not await encode_base64_async(big_path)
+        
+        logger.info("✅ Encoding cached per file version")
+    
+    async def test_resolve_media(self, tmp_path):
+        """Test that URLs and data URIs pass through and paths are encoded."""
+        logger.info("🧪 Testing resolve_media")
+        
+        url = "https://example.com/image.jpg"
+        data_uri = "data:image/jpeg;base64,/9j/4AAQSkZJRg=="
+        file_path = tmp_path / "photo.png"
+        file_path.write_bytes(b"png-bytes")
+        
+        assert await resolve_media(url) is url
+        assert await resolve_media(data_uri) is data_uri
+        assert await resolve_media(file_path) == encode_base64(file_path)
+        assert await resolve_media(str(file_path)) == encode_base64(file_path)
+        
+        with pytest.raises(ValidationError):
+            await resolve_media("data:not-base64")
+        
+        logger.info("✅ Media resolved correctly")
+
+
 @pytest.mark.unit
 class TestGroupIDDetection:
     """Test group ID detection."""
@@ -383,3 +479,106 @@ class TestEdgeCases:
         assert result == "application/octet-stream"
         
         logger.info("✅ No extension handled")
+
+
+@pytest.mark.unit
+class TestUtils:
+    """Test public utilities in utils.py."""
+    
+    def test_version_parse(self):
+        """Test version parsing and the shared parse cache."""
+        logger.info("🧪 Testing Version")
+        
+        version = Version("1.12.3")
+        assert (version.major, version.minor, version.patch) == (1, 12, 3)
+        assert str(version) == "1.12.3"
+        
+        short = Version("2")
+        assert (short.major, short.minor, short.patch) == (2, 0, 0)
+        
+        big = Version("2024.010.300")
+        assert (big.major, big.minor, big.patch) == (2024, 10, 300)
+        
+        pre = Version("0.57.0rc1")
+        assert (pre.major, pre.minor, pre.patch) == (0, 57, 0)
+        
+        with pytest.raises(ValueError):
+            Version("latest")
+        
+        assert Version.parse("0.1.0") is Version.parse("0.1.0")
+        
+        assert Version("1.2") == Version("1.2.0")
+        assert Version("1.10.0") > Version("1.9.9")
+        assert len({Version("1.2"), Version("1.2.0")}) == 1
+        
+        built = Version.from_tuple(1, 12, 3)
+        assert built == version
+        assert str(built) == "1.12.3"
+        assert built.patch == 3
+        assert not hasattr(version, "__dict__")
+        
+        logger.info("✅ Version parsed")
+    
+    def test_remove_none_values(self):
+        """Test None stripping, copying and in place."""
+        logger.info("🧪 Testing remove_none_values")
+        
+        data = {"phone": "5511999999999", "delayMessage": None, "fromMe": False}
+        
+        cleaned = remove_none_values(data)
+        assert cleaned == {"phone": "5511999999999", "fromMe": False}
+        assert "delayMessage" in data  # Input untouched
+        
+        result = remove_none_values(data, inplace=True)
+        assert result is data
+        assert data == {"phone": "5511999999999", "fromMe": False}
+        
+        # Nothing to remove: returned as is, without a copy
+        assert remove_none_values(data) is data
+        
+        logger.info("✅ None values removed")
+    
+    def test_ensure_list(self):
+        """Test normalizing values to lists."""
+        logger.info("🧪 Testing ensure_list")
+        
+        phones = ["5511999999999"]
+        
+        assert ensure_list(phones) is phones
+        assert ensure_list("5511999999999") == ["5511999999999"]
+        assert ensure_list(("a", "b")) == ["a", "b"]
+        assert ensure_list(None) == []
+        
+        logger.info("✅ Values normalized")
+    
+    def test_setup_logging(self, monkeypatch):
+        """Test that setup_logging installs one handler on a bare root logger."""
+        logger.info("🧪 Testing setup_logging")
+        
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        
+        setup_logging(logging.DEBUG)
+        setup_logging(logging.WARNING)  # Already configured: no-op
+        
+        assert len(root.handlers) == 1
+        assert root.level == logging.DEBUG
+        assert "%(levelname)s" in root.handlers[0].formatter._fmt
+        
+        # Same output as the stock formatter, including milliseconds
+        formatter = root.handlers[0].formatter
+        stock = logging.Formatter(formatter._fmt)
+        for created in (1700000000.123, 1700000000.987, 1700000001.5):
+            record = logging.LogRecord("zapi", logging.INFO, __file__, 1, "hi", None, None)
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            assert formatter.format(record) == stock.format(record)
+        
+        # Like the stdlib, a cleared msec format leaves the time unsuffixed
+        monkeypatch.setattr(formatter, "default_msec_format", None)
+        monkeypatch.setattr(stock, "default_msec_format", None)
+        record = logging.LogRecord("zapi", logging.INFO, __file__, 1, "hi", None, None)
+        assert formatter.format(record) == stock.format(record)
+        
+        logger.info("✅ Logging configured once")
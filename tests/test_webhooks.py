@@ -5,7 +5,9 @@ Tests the parse_webhook_message function and all message type classes.
 """
 
 import pytest
+import json
 import logging
+from dataclasses import asdict
 from datetime import datetime
 
 from zapi_async.types import (
@@ -50,6 +52,21 @@ class TestWebhookMessageParsing:
         
         logger.info(f"✅ Text message parsed: '{message.message}'")
     
+    def test_parse_raw_body(self, mock_webhook_text_message):
+        """Test parsing the undecoded webhook request body."""
+        logger.info("🧪 Testing parse_webhook_message (raw bytes)")
+        
+        body = json.dumps(mock_webhook_text_message).encode()
+        
+        message = parse_webhook_message(body)
+        
+        assert isinstance(message, TextMessage)
+        assert message.message == "Hello, this is a test message!"
+        assert parse_webhook_message(body.decode()).message_id == message.message_id
+        assert parse_webhook_message(bytearray(body)).message_id == message.message_id
+        
+        logger.info("✅ Raw body parsed")
+    
     def test_parse_image_message(self, mock_webhook_image_message):
         """Test parsing image message webhook."""
         logger.info("🧪 Testing parse_webhook_message (image)")
@@ -348,6 +365,15 @@ class TestMessageTypes:
         # Test timestamp conversion from milliseconds
         assert isinstance(message.timestamp, datetime)
         assert message.moment == 1632228638000
+        assert message.timestamp is message.timestamp  # Computed once
+        assert message.timestamp == datetime.fromtimestamp(1632228638)
+        
+        # The cache is not a dataclass field, so asdict() stays JSON-safe
+        json.dumps(asdict(message))
+        
+        # Reassigning moment invalidates the cached value
+        message.moment = 1700000000000
+        assert message.timestamp == datetime.fromtimestamp(1700000000)
         
         logger.info(f"✅ Timestamp: {message.timestamp}")
     
@@ -363,6 +389,46 @@ class TestMessageTypes:
         assert message._raw["messageId"] == "MSG123ABC"
         
         logger.info("✅ Raw data preserved correctly")
+    
+    def test_raw_data_disabled(self, mock_webhook_image_message, monkeypatch):
+        """Test that the raw payload can be dropped to save memory."""
+        logger.info("🧪 Testing STORE_RAW = False")
+        
+        from zapi_async.types import message as message_module
+        monkeypatch.setattr(message_module, "STORE_RAW", False)
+        
+        message = parse_webhook_message(mock_webhook_image_message)
+        
+        assert message._raw is None
+        assert message.image_url == "https://example.com/image.jpg"
+        
+        logger.info("✅ Raw data not stored")
+    
+    def test_messages_use_slots(self, mock_webhook_text_message):
+        """Test that parsed messages don't carry a per-instance __dict__."""
+        logger.info("🧪 Testing slotted message instances")
+        
+        message = parse_webhook_message(mock_webhook_text_message)
+        
+        assert not hasattr(message, "__dict__")
+        with pytest.raises(AttributeError):
+            message.unknown_field = 1
+        
+        logger.info("✅ Messages are slotted")
+    
+    def test_low_cardinality_fields_interned(self, mock_webhook_image_message):
+        """Test that status/type/mime_type values are shared across messages."""
+        logger.info("🧪 Testing interned string fields")
+        
+        body = json.dumps(mock_webhook_image_message)
+        first = parse_webhook_message(json.loads(body))
+        second = parse_webhook_message(json.loads(body))
+        
+        assert first.status is second.status
+        assert first.type is second.type
+        assert first.mime_type is second.mime_type
+        
+        logger.info("✅ String fields interned")
 
 
 @pytest.mark.unit
@@ -24,6 +24,7 @@ Example:
 """
 
 from .client import ZAPIClient
+from .transport import AsyncTransport, AiohttpTransport
 from .errors import (
     ZAPIError,
     AuthenticationError,
@@ -74,6 +75,10 @@ __all__ = [
     # Main client
     'ZAPIClient',
     
+    # Transports
+    'AsyncTransport',
+    'AiohttpTransport',
+    
     # Exceptions
     'ZAPIError',
     'AuthenticationError',
@@ -1,6 +1,9 @@
 """Internal helper functions for zapi_async."""
 
 from __future__ import annotations
+import asyncio
+import functools
+import os
 import re
 import base64
 import mimetypes
@@ -10,6 +13,22 @@ from urllib.parse import urlparse
 
 from .errors import ValidationError
 
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Matches the common pass-through media values (http(s) URLs with a host and
+# base64 data URIs) in a single scan; anything else takes the slower checks
+_REMOTE_MEDIA_RE = re.compile(r'https?://[^/?#\s]|data:[^,]*;base64,')
+
+# Read size for base64 encoding; a multiple of 3 so no padding is emitted mid-stream
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+# Files up to this size have their encoding cached (e.g. one photo pushed to
+# many groups); larger media is always re-read. The cache is process-wide and
+# holds up to _B64_CACHE_SIZE entries until evicted, so at most ~5.6 MB of
+# data URIs (16 x 256 KiB, plus a third for base64) stay in memory.
+_B64_CACHE_MAX_FILE_SIZE = 256 * 1024
+_B64_CACHE_SIZE = 16
+
 
 def format_phone(phone: str | int) -> str:
     """
@@ -27,9 +46,18 @@ def format_phone(phone: str | int) -> str:
     Raises:
         ValidationError: If phone number is invalid
     """
-    # Convert to string and remove all non-digit characters
-    phone_str = str(phone)
-    digits_only = re.sub(r'\D', '', phone_str)
+    # Fast path: already normalized (the common case for numbers from a DB).
+    # isascii() guards against Unicode digits like '²' that isdigit() accepts.
+    if type(phone) is str and 10 <= len(phone) <= 15 and phone.isascii() and phone.isdigit():
+        return phone
+    return _format_phone(str(phone))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_phone(phone_str: str) -> str:
+    """Cached implementation of format_phone (bulk sends repeat numbers)."""
+    # Remove all non-digit characters
+    digits_only = _NON_DIGIT_RE.sub('', phone_str)
     
     if not digits_only:
         raise ValidationError("Phone number cannot be empty")
@@ -81,22 +109,91 @@ def encode_base64(file_path: str | Path) -> str:
         raise ValidationError(f"Not a file: {file_path}")
     
     try:
-        with open(path, 'rb') as f:
-            file_bytes = f.read()
-        
-        # Encode to base64
-        b64_string = base64.b64encode(file_bytes).decode('utf-8')
-        
-        # Get mime type
+        # Start with the data URI prefix
         mime_type = get_mime_type(path)
+        encoded = bytearray(f"data:{mime_type};base64,".encode('ascii'))
         
-        # Return with data URI prefix
-        return f"data:{mime_type};base64,{b64_string}"
+        # Encode in chunks so the raw file is never fully held in memory
+        with open(path, 'rb') as f:
+            while chunk := f.read(_B64_CHUNK_SIZE):
+                encoded += base64.b64encode(chunk)
+        
+        return encoded.decode('ascii')
     
     except Exception as e:
         raise ValidationError(f"Failed to encode file: {e}")
 
 
+async def encode_base64_async(file_path: str | Path) -> str:
+    """
+    Encode file to base64 data URI without blocking the event loop.
+    
+    File reading and encoding run in a worker thread.
+    
+    Args:
+        file_path: Path to file
+        
+    Returns:
+        Base64 string with data URI prefix
+        
+    Raises:
+        ValidationError: If file doesn't exist or can't be read
+    """
+    return await asyncio.to_thread(_encode_base64_cached, file_path)
+
+
+def _encode_base64_cached(file_path: str | Path) -> str:
+    """Encode a file, reusing the result for unchanged small files."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        # Let encode_base64 raise the proper ValidationError
+        return encode_base64(file_path)
+    
+    if stat.st_size > _B64_CACHE_MAX_FILE_SIZE:
+        return encode_base64(file_path)
+    # Modification time and size in the key invalidate edited files
+    return _encode_base64_keyed(os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=_B64_CACHE_SIZE)
+def _encode_base64_keyed(file_path: str, mtime_ns: int, size: int) -> str:
+    """Cached encode_base64 keyed on the file's path, mtime and size."""
+    return encode_base64(file_path)
+
+
+async def resolve_media(value: str | Path) -> str:
+    """
+    Resolve a media argument to the value Z-API expects.
+    
+    URLs and base64 data URIs are passed through; file paths are encoded
+    to a base64 data URI (off the event loop).
+    
+    Args:
+        value: Media URL, base64 data URI, or file path
+        
+    Returns:
+        URL or base64 data URI
+        
+    Raises:
+        ValidationError: If a file path doesn't exist or can't be read
+    """
+    if isinstance(value, Path):
+        return await encode_base64_async(value)
+    
+    if _REMOTE_MEDIA_RE.match(value):
+        return value
+    
+    # A cheap prefix test picks the single check that can match
+    if value.startswith('data:'):
+        if is_base64(value):
+            return value
+    elif is_url(value):
+        return value
+    
+    return await encode_base64_async(value)
+
+
 def get_mime_type(file_path: str | Path) -> str:
     """
     Get MIME type for file.
@@ -213,11 +310,7 @@ def validate_phone_list(phones: list[str | int]) -> list[str]:
     if not phones:
         raise ValidationError("Phone list cannot be empty")
     
-    formatted = []
-    for phone in phones:
-        formatted.append(format_phone(phone))
-    
-    return formatted
+    return list(map(format_phone, phones))
 
 
 def build_request_body(**kwargs: Any) -> dict[str, Any]:
@@ -1,10 +1,19 @@
 """Internal API for Z-API HTTP operations."""
 
 from __future__ import annotations
+import asyncio
+import importlib.util
+import inspect
 import logging
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Awaitable, Iterable, Literal, TypeVar
 import httpx
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+from .transport import AsyncTransport
 from .errors import (
     ZAPIError,
     AuthenticationError,
@@ -14,20 +23,56 @@ from .errors import (
     ValidationError,
 )
 
+# HTTP/2 needs the optional 'h2' package (pip install 'httpx[http2]')
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 _logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Status code -> (exception type, message template). Templates are formatted
+# with the error message extracted from the response body.
+_STATUS_MAP: dict[int, tuple[type[ZAPIError], str]] = {
+    401: (AuthenticationError, "Authentication failed: {}"),
+    403: (AuthenticationError, "Authentication failed: {}"),
+    404: (InstanceError, "Instance not found or not connected: {}"),
+    405: (ValidationError, "Method not allowed: Check HTTP method (GET/POST/PUT/DELETE)"),
+    415: (ValidationError, "Unsupported media type: Check Content-Type header"),
+    429: (RateLimitError, "Rate limit exceeded: {}"),
+}
+_SERVER_ERROR: tuple[type[ZAPIError], str] = (ZAPIError, "Server error: {}")
+_GENERIC_ERROR: tuple[type[ZAPIError], str] = (ZAPIError, "Request failed: {}")
+
+
+def _parse_json(response: Any) -> Any:
+    """Parse a response body, using orjson on the raw bytes when available."""
+    if orjson is not None:
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes):
+            return orjson.loads(content)
+    return response.json()
+
 
 class GraphAPI:
     """Internal API class for making HTTP requests to Z-API."""
     
     BASE_URL = "https://api.z-api.io"
     
+    # Connection pool for the default session: keep sockets alive between
+    # calls so sends don't pay a TCP+TLS handshake each time
+    DEFAULT_LIMITS = httpx.Limits(
+        max_keepalive_connections=100,
+        max_connections=200,
+        keepalive_expiry=60,
+    )
+    
     def __init__(
         self,
         instance_id: str,
         token: str,
         client_token: str | None = None,
-        session: httpx.AsyncClient | None = None,
+        session: httpx.AsyncClient | AsyncTransport | None = None,
+        force_ipv4: bool = False,
     ):
         """
         Initialize GraphAPI.
@@ -36,13 +81,42 @@ class GraphAPI:
             instance_id: Z-API instance ID
             token: Z-API token
             client_token: Optional security client token
-            session: Optional httpx AsyncClient session
+            session: Optional httpx AsyncClient session or custom transport
+                (e.g. AiohttpTransport)
+            force_ipv4: Connect over IPv4 only, avoiding dual-stack fallback
+                delays on networks with broken IPv6 (ignored if session is given)
         """
         self.instance_id = instance_id
         self.token = token
         self.client_token = client_token
-        self._session = session or httpx.AsyncClient(timeout=30.0)
+        # Static headers are normalized once instead of on every request
+        self._base_headers = httpx.Headers({
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            **({"Client-Token": client_token} if client_token else {}),
+        })
+        if session is None:
+            # HTTP/2 multiplexes concurrent requests over one connection
+            transport = httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=self.DEFAULT_LIMITS,
+                retries=1,
+                local_address="0.0.0.0" if force_ipv4 else None,
+            )
+            # The default client carries the static headers itself, so
+            # requests only send per-call extras
+            session = httpx.AsyncClient(
+                timeout=30.0,
+                transport=transport,
+                headers=self._base_headers,
+            )
+            self._request_headers: httpx.Headers | None = None
+        else:
+            # Caller-provided sessions don't know our headers
+            self._request_headers = self._base_headers
+        self._session: httpx.AsyncClient | AsyncTransport = session
         self._base_url = f"{self.BASE_URL}/instances/{instance_id}/token/{token}"
+        self._url_prefix = f"{self._base_url}/"
     
     def __str__(self) -> str:
         return f"GraphAPI(instance={self.instance_id})"
@@ -58,30 +132,26 @@ class GraphAPI:
             Full URL
         """
         # Remove leading slash if present
-        endpoint = endpoint.lstrip('/')
-        return f"{self._base_url}/{endpoint}"
+        if endpoint.startswith('/'):
+            endpoint = endpoint.lstrip('/')
+        return self._url_prefix + endpoint
     
-    def _build_headers(self, extra_headers: dict[str, str] | None = None) -> dict[str, str]:
+    def _build_headers(self, extra_headers: dict[str, str] | None = None) -> httpx.Headers | None:
         """
-        Build request headers.
+        Build per-request headers.
         
         Args:
             extra_headers: Additional headers to include
             
         Returns:
-            Complete headers dict
+            Headers to send with the request, or None when the session
+            already carries everything needed
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        
-        if self.client_token:
-            headers["Client-Token"] = self.client_token
-        
-        if extra_headers:
-            headers.update(extra_headers)
+        if not extra_headers:
+            return self._request_headers
         
+        headers = httpx.Headers(self._request_headers)
+        headers.update(extra_headers)
         return headers
     
     async def _make_request(
@@ -92,6 +162,7 @@ class GraphAPI:
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         log_request: bool = True,
+        content: bytes | None = None,
     ) -> dict[str, Any]:
         """
         Make HTTP request to Z-API.
@@ -103,6 +174,7 @@ class GraphAPI:
             params: URL parameters
             headers: Additional headers
             log_request: Whether to log request details
+            content: Raw request body (used instead of json)
             
         Returns:
             Response JSON data
@@ -123,6 +195,11 @@ class GraphAPI:
             if json and _logger.isEnabledFor(logging.DEBUG):
                 _logger.debug(f"Request body: {json}")
         
+        # Serialize with orjson when available (much faster than stdlib json)
+        if json is not None and orjson is not None:
+            content = orjson.dumps(json)
+            json = None
+        
         try:
             response = await self._session.request(
                 method=method,
@@ -130,6 +207,7 @@ class GraphAPI:
                 json=json,
                 params=params,
                 headers=request_headers,
+                content=content,
             )
             
             # Log response status
@@ -141,8 +219,7 @@ class GraphAPI:
             
             # Parse JSON response
             try:
-                data = response.json()
-                return data
+                return _parse_json(response)
             except Exception:
                 # Some endpoints might return empty response
                 return {}
@@ -167,55 +244,30 @@ class GraphAPI:
         status_code = response.status_code
         
         # Try to parse error message from response
+        error_data: dict[str, Any] = {}
         try:
             error_data = response.json()
             error_message = error_data.get('message') or error_data.get('error') or response.text
         except Exception:
+            error_data = {}
             error_message = response.text or f"HTTP {status_code}"
         
         # Map status codes to exception types
-        if status_code == 401 or status_code == 403:
-            raise AuthenticationError(
-                f"Authentication failed: {error_message}",
-                status_code=status_code,
-                response_data=error_data if 'error_data' in locals() else {}
-            )
-        elif status_code == 404:
-            raise InstanceError(
-                f"Instance not found or not connected: {error_message}",
-                status_code=status_code
-            )
-        elif status_code == 405:
-            raise ValidationError(
-                f"Method not allowed: Check HTTP method (GET/POST/PUT/DELETE)",
-                status_code=status_code
-            )
-        elif status_code == 415:
-            raise ValidationError(
-                f"Unsupported media type: Check Content-Type header",
-                status_code=status_code
-            )
-        elif status_code == 429:
-            raise RateLimitError(
-                f"Rate limit exceeded: {error_message}",
-                status_code=status_code
-            )
-        elif status_code >= 500:
-            raise ZAPIError(
-                f"Server error: {error_message}",
-                status_code=status_code
-            )
-        else:
-            raise ZAPIError(
-                f"Request failed: {error_message}",
-                status_code=status_code
-            )
+        exc_type, template = _STATUS_MAP.get(status_code) or (
+            _SERVER_ERROR if status_code >= 500 else _GENERIC_ERROR
+        )
+        raise exc_type(
+            template.format(error_message),
+            status_code=status_code,
+            response_data=error_data,
+        )
     
     async def get(
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
-        **kwargs
+        headers: dict[str, str] | None = None,
+        log_request: bool = True,
     ) -> dict[str, Any]:
         """
         Make GET request.
@@ -223,18 +275,23 @@ class GraphAPI:
         Args:
             endpoint: API endpoint
             params: URL parameters
-            **kwargs: Additional request arguments
+            headers: Additional headers
+            log_request: Whether to log request details
             
         Returns:
             Response data
         """
-        return await self._make_request("GET", endpoint, params=params, **kwargs)
+        return await self._make_request(
+            "GET", endpoint, params=params, headers=headers, log_request=log_request
+        )
     
     async def post(
         self,
         endpoint: str,
         json: dict[str, Any] | None = None,
-        **kwargs
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        log_request: bool = True,
     ) -> dict[str, Any]:
         """
         Make POST request.
@@ -242,18 +299,24 @@ class GraphAPI:
         Args:
             endpoint: API endpoint
             json: Request body
-            **kwargs: Additional request arguments
+            params: URL parameters
+            headers: Additional headers
+            log_request: Whether to log request details
             
         Returns:
             Response data
         """
-        return await self._make_request("POST", endpoint, json=json, **kwargs)
+        return await self._make_request(
+            "POST", endpoint, json=json, params=params, headers=headers, log_request=log_request
+        )
     
     async def put(
         self,
         endpoint: str,
         json: dict[str, Any] | None = None,
-        **kwargs
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        log_request: bool = True,
     ) -> dict[str, Any]:
         """
         Make PUT request.
@@ -261,29 +324,162 @@ class GraphAPI:
         Args:
             endpoint: API endpoint
             json: Request body
-            **kwargs: Additional request arguments
+            params: URL parameters
+            headers: Additional headers
+            log_request: Whether to log request details
             
         Returns:
             Response data
         """
-        return await self._make_request("PUT", endpoint, json=json, **kwargs)
+        return await self._make_request(
+            "PUT", endpoint, json=json, params=params, headers=headers, log_request=log_request
+        )
     
     async def delete(
         self,
         endpoint: str,
-        **kwargs
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        log_request: bool = True,
     ) -> dict[str, Any]:
         """
         Make DELETE request.
         
         Args:
             endpoint: API endpoint
-            **kwargs: Additional request arguments
+            params: URL parameters
+            headers: Additional headers
+            log_request: Whether to log request details
             
         Returns:
             Response data
         """
-        return await self._make_request("DELETE", endpoint, **kwargs)
+        return await self._make_request(
+            "DELETE", endpoint, params=params, headers=headers, log_request=log_request
+        )
+    
+    async def post_binary(
+        self,
+        endpoint: str,
+        content: bytes,
+        content_type: str,
+        extra_fields: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Make POST request with a raw binary body.
+        
+        For endpoints that accept raw uploads, this skips the base64-in-JSON
+        encoding (4/3x size and two extra encode passes) entirely.
+        
+        Args:
+            endpoint: API endpoint
+            content: Raw request body
+            content_type: MIME type of the body (e.g. "image/jpeg")
+            extra_fields: Additional fields, sent as URL parameters
+            
+        Returns:
+            Response data
+        """
+        _logger.debug(f"Binary body: {len(content)} bytes ({content_type})")
+        return await self._make_request(
+            "POST",
+            endpoint,
+            params=extra_fields,
+            headers={"Content-Type": content_type},
+            content=content,
+        )
+    
+    async def warmup(self) -> None:
+        """
+        Open a connection to Z-API ahead of the first real request.
+        
+        Issues a cheap status request so DNS resolution and the TLS handshake
+        happen up front instead of adding latency to the first send. HTTP
+        error responses are ignored since the connection is established anyway.
+        
+        Raises:
+            NetworkError: If Z-API cannot be reached
+        """
+        try:
+            await self.get("status", log_request=False)
+        except NetworkError:
+            raise
+        except ZAPIError as e:
+            _logger.debug(f"Warmup request returned an error: {e}")
+    
+    async def iter_bounded(
+        self,
+        coros: Iterable[Awaitable[T]],
+        limit: int = 128,
+    ) -> AsyncIterator[T]:
+        """
+        Run awaitables with bounded concurrency, yielding results as they finish.
+        
+        Unlike ``asyncio.as_completed``, at most ``limit`` awaitables are in
+        flight at any time, so large batches don't open thousands of
+        concurrent requests against the connection pool.
+        
+        Args:
+            coros: Awaitables to run (e.g. ``api.post(...)`` calls)
+            limit: Maximum number of awaitables running concurrently
+            
+        Yields:
+            Results in completion order
+            
+        Raises:
+            ValidationError: If limit is lower than 1
+            BaseException: The first error raised by any awaitable,
+                including asyncio.CancelledError
+            
+        Example:
+            >>> calls = (api.post("send-text", json=b) for b in bodies)
+            >>> async for result in api.iter_bounded(calls, limit=50):
+            ...     print(result)
+        """
+        if limit < 1:
+            raise ValidationError(f"limit must be at least 1, got {limit}")
+        
+        pending: asyncio.Queue[Awaitable[T]] = asyncio.Queue()
+        for coro in coros:
+            pending.put_nowait(coro)
+        total = pending.qsize()
+        results: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue()
+        # Set before the workers are cancelled, so a CancelledError raised by
+        # an awaitable can be told apart from the worker's own cancellation
+        stopping = False
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    coro = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results.put_nowait((await coro, None))
+                except BaseException as e:
+                    if stopping:
+                        raise
+                    # Report every failure, CancelledError included, or the
+                    # consumer would wait forever for this item
+                    results.put_nowait((None, e))
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(limit, total))]
+        try:
+            for _ in range(total):
+                result, error = await results.get()
+                if error is not None:
+                    raise error
+                yield result
+        finally:
+            stopping = True
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # Close awaitables that never started to avoid "never awaited" warnings
+            while not pending.empty():
+                coro = pending.get_nowait()
+                if inspect.iscoroutine(coro):
+                    coro.close()
     
     async def close(self) -> None:
         """Close the HTTP session."""
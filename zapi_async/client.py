@@ -1,24 +1,31 @@
 """Main Z-API async client."""
 
 from __future__ import annotations
+import asyncio
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Literal, TypeVar, overload
 import httpx
 
 from .api import GraphAPI
+from .transport import AsyncTransport
 from .errors import ValidationError
-from ._helpers import (
-    format_phone,
-    is_url,
-    is_base64,
-    encode_base64,
-    build_request_body,
-)
+from ._helpers import format_phone, resolve_media
+from .utils import remove_none_values
 from .types import SentMessage, InstanceStatus, QRCode, PhoneCode
+from .types import GroupCreated, GroupMetadata, GroupInviteInfo
 
 _logger = logging.getLogger(__name__)
 
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+# Phone lists longer than this are formatted off the event loop
+_PHONE_THREAD_THRESHOLD = 256
+
+# Body fields that accept a URL, base64 data URI, or local file path
+_MEDIA_FIELDS = ("image", "video", "audio", "document", "sticker")
+
 
 class ZAPIClient:
     """
@@ -48,7 +55,8 @@ class ZAPIClient:
         instance_id: str,
         token: str,
         client_token: str | None = None,
-        session: httpx.AsyncClient | None = None,
+        session: httpx.AsyncClient | AsyncTransport | None = None,
+        force_ipv4: bool = False,
     ):
         """
         Initialize Z-API client.
@@ -57,7 +65,9 @@ class ZAPIClient:
             instance_id: Z-API instance ID
             token: Z-API token
             client_token: Optional security client token (recommended)
-            session: Optional httpx AsyncClient (for custom configuration)
+            session: Optional httpx AsyncClient (for custom configuration) or
+                custom transport such as AiohttpTransport
+            force_ipv4: Connect over IPv4 only (ignored if session is given)
         """
         self.instance_id = instance_id
         self.token = token
@@ -67,6 +77,7 @@ class ZAPIClient:
             token=token,
             client_token=client_token,
             session=session,
+            force_ipv4=force_ipv4,
         )
     
     def __repr__(self) -> str:
@@ -137,8 +148,44 @@ class ZAPIClient:
         """
         return await self.api.post("disconnect")
     
+    async def warmup(self) -> None:
+        """
+        Establish the connection to Z-API before the first real request.
+        
+        Folds DNS resolution and the TLS handshake out of first-request latency.
+        
+        Example:
+            >>> client = ZAPIClient(instance_id, token)
+            >>> await client.warmup()
+        """
+        await self.api.warmup()
+    
     # ========== Message Sending - Text ==========
     
+    @overload
+    async def send_text(
+        self,
+        phone: str | int,
+        message: str,
+        *,
+        delay_message: int | None = ...,
+        delay_typing: int | None = ...,
+        edit_message_id: str | None = ...,
+        raw: Literal[False] = ...,
+    ) -> SentMessage: ...
+    
+    @overload
+    async def send_text(
+        self,
+        phone: str | int,
+        message: str,
+        *,
+        delay_message: int | None = ...,
+        delay_typing: int | None = ...,
+        edit_message_id: str | None = ...,
+        raw: Literal[True],
+    ) -> dict[str, Any]: ...
+    
     async def send_text(
         self,
         phone: str | int,
@@ -147,7 +194,8 @@ class ZAPIClient:
         delay_message: int | None = None,
         delay_typing: int | None = None,
         edit_message_id: str | None = None,
-    ) -> SentMessage:
+        raw: bool = False,
+    ) -> SentMessage | dict[str, Any]:
         """
         Send text message.
         
@@ -157,9 +205,10 @@ class ZAPIClient:
             delay_message: Delay before sending (1-15 seconds)
             delay_typing: Show "typing..." status duration (1-15 seconds)
             edit_message_id: Message ID to edit (requires webhook configuration)
+            raw: Return the raw response dict instead of a SentMessage
             
         Returns:
-            Sent message info
+            Sent message info (raw response dict if raw=True)
             
         Example:
             >>> result = await client.send_text(
@@ -167,15 +216,17 @@ class ZAPIClient:
             ...     message="Hello! *This is bold* and _this is italic_"
             ... )
         """
-        body = build_request_body(
-            phone=format_phone(phone),
-            message=message,
-            delayMessage=delay_message,
-            delayTyping=delay_typing,
-            editMessageId=edit_message_id,
-        )
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "message": message,
+            "delayMessage": delay_message,
+            "delayTyping": delay_typing,
+            "editMessageId": edit_message_id,
+        }, inplace=True)
         
         data = await self.api.post("send-text", json=body)
+        if raw:
+            return data
         return SentMessage.from_dict(data)
     
     # ========== Message Sending - Media ==========
@@ -218,19 +269,17 @@ class ZAPIClient:
             ...     image="/path/to/image.jpg"
             ... )
         """
-        # Handle file path
-        image_value = image
-        if isinstance(image, Path) or (isinstance(image, str) and not is_url(image) and not is_base64(image)):
-            image_value = encode_base64(image)
-        
-        body = build_request_body(
-            phone=format_phone(phone),
-            image=str(image_value),
-            caption=caption,
-            messageId=message_id,
-            delayMessage=delay_message,
-            viewOnce=view_once,
-        )
+        # Handle URL, base64 or file path
+        image_value = await resolve_media(image)
+        
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "image": image_value,
+            "caption": caption,
+            "messageId": message_id,
+            "delayMessage": delay_message,
+            "viewOnce": view_once,
+        }, inplace=True)
         
         data = await self.api.post("send-image", json=body)
         return SentMessage.from_dict(data)
@@ -259,18 +308,16 @@ class ZAPIClient:
         Returns:
             Sent message info
         """
-        video_value = video
-        if isinstance(video, Path) or (isinstance(video, str) and not is_url(video) and not is_base64(video)):
-            video_value = encode_base64(video)
-        
-        body = build_request_body(
-            phone=format_phone(phone),
-            video=str(video_value),
-            caption=caption,
-            messageId=message_id,
-            delayMessage=delay_message,
-            viewOnce=view_once,
-        )
+        video_value = await resolve_media(video)
+        
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "video": video_value,
+            "caption": caption,
+            "messageId": message_id,
+            "delayMessage": delay_message,
+            "viewOnce": view_once,
+        }, inplace=True)
         
         data = await self.api.post("send-video", json=body)
         return SentMessage.from_dict(data)
@@ -295,16 +342,14 @@ class ZAPIClient:
         Returns:
             Sent message info
         """
-        audio_value = audio
-        if isinstance(audio, Path) or (isinstance(audio, str) and not is_url(audio) and not is_base64(audio)):
-            audio_value = encode_base64(audio)
+        audio_value = await resolve_media(audio)
         
-        body = build_request_body(
-            phone=format_phone(phone),
-            audio=str(audio_value),
-            messageId=message_id,
-            delayMessage=delay_message,
-        )
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "audio": audio_value,
+            "messageId": message_id,
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-audio", json=body)
         return SentMessage.from_dict(data)
@@ -333,20 +378,19 @@ class ZAPIClient:
         Returns:
             Sent message info
         """
-        document_value = document
-        if isinstance(document, Path) or (isinstance(document, str) and not is_url(document) and not is_base64(document)):
-            document_value = encode_base64(document)
-            if not filename and isinstance(document, (str, Path)):
-                filename = Path(document).name
-        
-        body = build_request_body(
-            phone=format_phone(phone),
-            document=str(document_value),
-            fileName=filename,
-            caption=caption,
-            messageId=message_id,
-            delayMessage=delay_message,
-        )
+        document_value = await resolve_media(document)
+        # A new value means a local file was encoded; default to its name
+        if not filename and document_value is not document:
+            filename = Path(document).name
+        
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "document": document_value,
+            "fileName": filename,
+            "caption": caption,
+            "messageId": message_id,
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-document", json=body)
         return SentMessage.from_dict(data)
@@ -375,16 +419,14 @@ class ZAPIClient:
             - Static stickers: 512x512 pixels, max 100KB
             - Animated stickers: 512x512 pixels, max 500KB
         """
-        sticker_value = sticker
-        if isinstance(sticker, Path) or (isinstance(sticker, str) and not is_url(sticker) and not is_base64(sticker)):
-            sticker_value = encode_base64(sticker)
+        sticker_value = await resolve_media(sticker)
         
-        body = build_request_body(
-            phone=format_phone(phone),
-            sticker=str(sticker_value),
-            messageId=message_id,
-            delayMessage=delay_message,
-        )
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "sticker": sticker_value,
+            "messageId": message_id,
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-sticker", json=body)
         return SentMessage.from_dict(data)
@@ -426,16 +468,16 @@ class ZAPIClient:
             ...     address="São Paulo, Brazil"
             ... )
         """
-        body = build_request_body(
-            phone=format_phone(phone),
-            latitude=latitude,
-            longitude=longitude,
-            name=name,
-            address=address,
-            url=url,
-            messageId=message_id,
-            delayMessage=delay_message,
-        )
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "latitude": latitude,
+            "longitude": longitude,
+            "name": name,
+            "address": address,
+            "url": url,
+            "messageId": message_id,
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-location", json=body)
         return SentMessage.from_dict(data)
@@ -469,13 +511,13 @@ class ZAPIClient:
             ...     contact_name="John Doe"
             ... )
         """
-        body = build_request_body(
-            phone=format_phone(phone),
-            contactPhone=format_phone(contact_phone),
-            contactName=contact_name,
-            messageId=message_id,
-            delayMessage=delay_message,
-        )
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "contactPhone": format_phone(contact_phone),
+            "contactName": contact_name,
+            "messageId": message_id,
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-contact", json=body)
         return SentMessage.from_dict(data)
@@ -516,16 +558,16 @@ class ZAPIClient:
             ...     title="Z-API - WhatsApp API"
             ... )
         """
-        body = build_request_body(
-            phone=format_phone(phone),
-            message=message,
-            url=url,
-            title=title,
-            description=description,
-            image=image,
-            messageId=message_id,
-            delayMessage=delay_message,
-        )
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "message": message,
+            "url": url,
+            "title": title,
+            "description": description,
+            "image": image,
+            "messageId": message_id,
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-link", json=body)
         return SentMessage.from_dict(data)
@@ -557,12 +599,12 @@ class ZAPIClient:
             ...     emoji="❤️"
             ... )
         """
-        body = build_request_body(
-            phone=format_phone(phone),
-            messageId=message_id,
-            reaction=emoji,
-            delayMessage=delay_message,
-        )
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "messageId": message_id,
+            "reaction": emoji,
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-reaction", json=body)
         return SentMessage.from_dict(data)
@@ -582,10 +624,10 @@ class ZAPIClient:
         Returns:
             Sent message info
         """
-        body = build_request_body(
-            phone=format_phone(phone),
-            messageId=message_id,
-        )
+        body = {
+            "phone": format_phone(phone),
+            "messageId": message_id,
+        }
         
         data = await self.api.post("send-remove-reaction", json=body)
         return SentMessage.from_dict(data)
@@ -623,12 +665,12 @@ class ZAPIClient:
             ...     buttons=buttons
             ... )
         """
-        body = build_request_body(
-            phone=format_phone(phone),
-            message=message,
-            buttonList={"buttons": buttons},
-            delayMessage=delay_message,
-        )
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "message": message,
+            "buttonList": {"buttons": buttons},
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-button-list", json=body)
         return SentMessage.from_dict(data)
@@ -670,16 +712,16 @@ class ZAPIClient:
             ...     options=options
             ... )
         """
-        body = build_request_body(
-            phone=format_phone(phone),
-            message=message,
-            optionList={
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "message": message,
+            "optionList": {
                 "title": title,
                 "buttonLabel": button_label,
                 "options": options
             },
-            delayMessage=delay_message,
-        )
+            "delayMessage": delay_message,
+        }, inplace=True)
         
         data = await self.api.post("send-option-list", json=body)
         return SentMessage.from_dict(data)
@@ -722,22 +764,214 @@ class ZAPIClient:
             ...     max_options=1
             ... )
         """
-        # Convert string list to poll format
-        poll_items = [{"name": option} for option in options]
+        body = remove_none_values({
+            "phone": format_phone(phone),
+            "message": message,
+            # Convert string list to poll format
+            "poll": [{"name": option} for option in options],
+            "pollMaxOptions": max_options,
+            "delayMessage": delay_message,
+        }, inplace=True)
         
-        body = build_request_body(
-            phone=format_phone(phone),
-            message=message,
-            poll=poll_items,
-            pollMaxOptions=max_options,
-            delayMessage=delay_message,
-        )
-        
-        data = await self.api.post("send-poll", json=body)  
+        data = await self.api.post("send-poll", json=body)
         return SentMessage.from_dict(data)
     
     
     
+    # ========== Bulk Sending ==========
+    
+    @overload
+    async def send_many(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        concurrency: int = ...,
+        endpoint: str = ...,
+        raw: Literal[False] = ...,
+    ) -> list[SentMessage | BaseException]: ...
+    
+    @overload
+    async def send_many(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        concurrency: int = ...,
+        endpoint: str = ...,
+        raw: Literal[True],
+    ) -> list[dict[str, Any] | BaseException]: ...
+    
+    async def send_many(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        concurrency: int = 50,
+        endpoint: str = "send-text",
+        raw: bool = False,
+    ) -> list[Any]:
+        """
+        Send many messages concurrently.
+        
+        Requests are fired in parallel over the shared connection pool, with at
+        most ``concurrency`` in flight at once. A failed send does not stop the
+        others; its exception (possibly asyncio.CancelledError) is returned
+        in place of the result.
+        
+        Args:
+            items: Request bodies using Z-API field names (e.g. ``phone``,
+                ``message``). ``phone`` is formatted automatically, media
+                fields (``image``, ``video``, ...) accept file paths like the
+                single-send methods, and None values are dropped.
+            concurrency: Maximum number of requests in flight
+            endpoint: Send endpoint shared by all items
+            raw: Return raw response dicts instead of SentMessage objects
+            
+        Returns:
+            SentMessage (or raw dict) or exception for each item, in input order
+            
+        Example:
+            >>> results = await client.send_many([
+            ...     {"phone": "5511999999999", "message": "Hi Ana"},
+            ...     {"phone": "5511888888888", "message": "Hi Bruno"},
+            ... ])
+            >>> failed = [r for r in results if isinstance(r, BaseException)]
+        """
+        # Build all bodies up front so validation errors surface before any I/O
+        bodies = [self._prepare_bulk_body(item) for item in items]
+        # Bound once per batch rather than looked up for every item
+        post = self.api.post
+        
+        async def send_one(body: dict[str, Any]) -> SentMessage | dict[str, Any]:
+            data = await post(endpoint, json=await self._resolve_bulk_media(body))
+            if raw:
+                return data
+            return SentMessage.from_dict(data)
+        
+        return await self._gather_bounded(send_one, bodies, concurrency)
+    
+    async def send_stream(
+        self,
+        bodies: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+        endpoint: str = "send-text",
+        *,
+        concurrency: int = 100,
+    ) -> int:
+        """
+        Send a stream of messages with bounded memory.
+        
+        Unlike ``send_many``, bodies are pulled from ``bodies`` lazily through
+        a small queue, so only a few items exist at any time regardless of how
+        many are sent. Suited for very large campaigns fed from a generator,
+        file or database cursor. Responses are not kept; the first failure
+        cancels the remaining sends and is raised.
+        
+        Args:
+            bodies: Sync or async iterable of request bodies, in the same
+                format as ``send_many`` items
+            endpoint: Send endpoint shared by all items
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Number of messages sent
+            
+        Raises:
+            ValidationError: If concurrency is lower than 1 or a body is invalid
+            ZAPIError: The first error raised by any send
+            
+        Example:
+            >>> rows = ({"phone": p, "message": "Hi"} for p in read_phones())
+            >>> sent = await client.send_stream(rows, concurrency=50)
+        """
+        if concurrency < 1:
+            raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
+        
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=concurrency * 2)
+        post = self.api.post
+        sent = 0
+        
+        async def produce() -> None:
+            if isinstance(bodies, AsyncIterable):
+                async for item in bodies:
+                    await queue.put(item)
+            else:
+                for item in bodies:
+                    await queue.put(item)
+            # One stop marker per consumer
+            for _ in range(concurrency):
+                await queue.put(None)
+        
+        async def consume() -> None:
+            nonlocal sent
+            while (item := await queue.get()) is not None:
+                body = await self._resolve_bulk_media(self._prepare_bulk_body(item))
+                await post(endpoint, json=body)
+                sent += 1
+        
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(consume()) for _ in range(concurrency))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # On failure, stop the producer and remaining consumers
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return sent
+    
+    @staticmethod
+    def _prepare_bulk_body(item: dict[str, Any]) -> dict[str, Any]:
+        """Drop None values and format the phone of a bulk request body."""
+        body = remove_none_values(item)
+        if "phone" in body:
+            body = {**body, "phone": format_phone(body["phone"])}
+        return body
+    
+    @staticmethod
+    async def _resolve_bulk_media(body: dict[str, Any]) -> dict[str, Any]:
+        """Encode media fields of a bulk request body."""
+        # Encode local media files in worker threads while other
+        # requests are in flight
+        media = {
+            field: await resolve_media(body[field])
+            for field in _MEDIA_FIELDS
+            if field in body
+        }
+        if media:
+            body = {**body, **media}
+        return body
+    
+    async def _gather_bounded(
+        self,
+        func: Callable[[_T], Awaitable[_R]],
+        items: Iterable[_T],
+        concurrency: int,
+    ) -> list[_R | BaseException]:
+        """
+        Run ``func`` over ``items`` concurrently, at most ``concurrency`` at a time.
+        
+        Args:
+            func: Coroutine function called once per item
+            items: Items to process
+            concurrency: Maximum number of calls in flight
+            
+        Returns:
+            Result or raised exception for each item, in input order. This
+            may be a BaseException such as asyncio.CancelledError, not only
+            an Exception.
+        """
+        if concurrency < 1:
+            raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(item: _T) -> _R:
+            async with semaphore:
+                return await func(item)
+        
+        return await asyncio.gather(
+            *(run(item) for item in items),
+            return_exceptions=True,
+        )
+    
     # ========== Groups ==========
     
     async def create_group(
@@ -746,7 +980,7 @@ class ZAPIClient:
         phones: list[str | int],
         *,
         auto_invite: bool = True,
-    ) -> "GroupCreated":
+    ) -> GroupCreated:
         """
         Create a WhatsApp group.
         
@@ -771,26 +1005,35 @@ class ZAPIClient:
             ... )
             >>> print(f"Group created: {result.group_id}")
         """
-        from .types.group import GroupCreated
-        
-        # Format all phones
-        formatted_phones = [format_phone(p) for p in phones]
+        # Format all phones; large lists are formatted in a worker thread so
+        # they don't stall other in-flight requests
+        if len(phones) > _PHONE_THREAD_THRESHOLD:
+            formatted_phones = await asyncio.to_thread(list, map(format_phone, phones))
+        else:
+            formatted_phones = list(map(format_phone, phones))
         
-        body = build_request_body(
-            groupName=group_name,
-            phones=formatted_phones,
-            autoInvite=auto_invite
-        )
+        body = {
+            "groupName": group_name,
+            "phones": formatted_phones,
+            "autoInvite": auto_invite,
+        }
         
         data = await self.api.post("create-group", json=body)
         return GroupCreated.from_dict(data)
     
-    async def get_group_metadata(self, group_id: str) -> "GroupMetadata":
+    async def get_group_metadata(
+        self,
+        group_id: str,
+        *,
+        include_participants: bool = True,
+    ) -> GroupMetadata:
         """
         Get complete group metadata.
         
         Args:
             group_id: Group ID (format: xxxxx-group or phone-timestamp)
+            include_participants: Parse the participant list; pass False
+                when only group info (subject, size, ...) is needed
             
         Returns:
             GroupMetadata with all group information
@@ -802,11 +1045,9 @@ class ZAPIClient:
             >>> for p in metadata.participants:
             ...     print(f"  - {p.phone} (admin={p.is_admin})")
         """
-        from .types.group import GroupMetadata
-        
-        body = build_request_body(groupId=group_id)
+        body = {"groupId": group_id}
         data = await self.api.post("group-metadata", json=body)
-        return GroupMetadata.from_dict(data)
+        return GroupMetadata.from_dict(data, include_participants=include_participants)
     
     async def add_participant(
         self,
@@ -832,11 +1073,11 @@ class ZAPIClient:
             ...     "5511999999999"
             ... )
         """
-        body = build_request_body(
-            groupId=group_id,
-            phone=format_phone(phone),
-            autoInvite=auto_invite
-        )
+        body = {
+            "groupId": group_id,
+            "phone": format_phone(phone),
+            "autoInvite": auto_invite,
+        }
         
         return await self.api.post("add-participant", json=body)
     
@@ -861,10 +1102,10 @@ class ZAPIClient:
             ...     "5511999999999"
             ... )
         """
-        body = build_request_body(
-            groupId=group_id,
-            phone=format_phone(phone)
-        )
+        body = {
+            "groupId": group_id,
+            "phone": format_phone(phone),
+        }
         
         return await self.api.post("remove-participant", json=body)
     
@@ -889,10 +1130,10 @@ class ZAPIClient:
             ...     "5511999999999"
             ... )
         """
-        body = build_request_body(
-            groupId=group_id,
-            phone=format_phone(phone)
-        )
+        body = {
+            "groupId": group_id,
+            "phone": format_phone(phone),
+        }
         
         return await self.api.post("promote-participant", json=body)
     
@@ -917,13 +1158,122 @@ class ZAPIClient:
             ...     "5511999999999"
             ... )
         """
-        body = build_request_body(
-            groupId=group_id,
-            phone=format_phone(phone)
-        )
+        body = {
+            "groupId": group_id,
+            "phone": format_phone(phone),
+        }
         
         return await self.api.post("demote-participant", json=body)
     
+    async def add_participants(
+        self,
+        group_id: str,
+        phones: list[str | int],
+        *,
+        auto_invite: bool = True,
+        concurrency: int = 20,
+    ) -> list[dict | BaseException]:
+        """
+        Add several participants to a group concurrently.
+        
+        Args:
+            group_id: Group ID
+            phones: Phone numbers to add
+            auto_invite: Send invite link if can't add directly
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Response dict or exception for each phone, in input order
+            
+        Example:
+            >>> results = await client.add_participants(
+            ...     "120363019502650977-group",
+            ...     ["5511999999999", "5511888888888"]
+            ... )
+        """
+        bodies = [
+            {"groupId": group_id, "phone": phone, "autoInvite": auto_invite}
+            for phone in map(format_phone, phones)
+        ]
+        return await self._post_many("add-participant", bodies, concurrency)
+    
+    async def remove_participants(
+        self,
+        group_id: str,
+        phones: list[str | int],
+        *,
+        concurrency: int = 20,
+    ) -> list[dict | BaseException]:
+        """
+        Remove several participants from a group concurrently.
+        
+        Args:
+            group_id: Group ID
+            phones: Phone numbers to remove
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Response dict or exception for each phone, in input order
+        """
+        bodies = [{"groupId": group_id, "phone": phone} for phone in map(format_phone, phones)]
+        return await self._post_many("remove-participant", bodies, concurrency)
+    
+    async def promote_to_admins(
+        self,
+        group_id: str,
+        phones: list[str | int],
+        *,
+        concurrency: int = 20,
+    ) -> list[dict | BaseException]:
+        """
+        Promote several participants to admin concurrently.
+        
+        Args:
+            group_id: Group ID
+            phones: Phone numbers to promote
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Response dict or exception for each phone, in input order
+        """
+        bodies = [{"groupId": group_id, "phone": phone} for phone in map(format_phone, phones)]
+        return await self._post_many("promote-participant", bodies, concurrency)
+    
+    async def demote_admins(
+        self,
+        group_id: str,
+        phones: list[str | int],
+        *,
+        concurrency: int = 20,
+    ) -> list[dict | BaseException]:
+        """
+        Demote several admins to regular participants concurrently.
+        
+        Args:
+            group_id: Group ID
+            phones: Phone numbers to demote
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Response dict or exception for each phone, in input order
+        """
+        bodies = [{"groupId": group_id, "phone": phone} for phone in map(format_phone, phones)]
+        return await self._post_many("demote-participant", bodies, concurrency)
+    
+    async def _post_many(
+        self,
+        endpoint: str,
+        bodies: list[dict[str, Any]],
+        concurrency: int,
+    ) -> list[dict | BaseException]:
+        """POST each body to the same endpoint with bounded concurrency."""
+        post = self.api.post
+        
+        async def post_one(body: dict[str, Any]) -> dict:
+            return await post(endpoint, json=body)
+        
+        return await self._gather_bounded(post_one, bodies, concurrency)
+    
     async def update_group_name(
         self,
         group_id: str,
@@ -945,10 +1295,10 @@ class ZAPIClient:
             ...     "New Group Name"
             ... )
         """
-        body = build_request_body(
-            groupId=group_id,
-            groupName=group_name
-        )
+        body = {
+            "groupId": group_id,
+            "groupName": group_name,
+        }
         
         return await self.api.post("update-group-name", json=body)
     
@@ -973,10 +1323,10 @@ class ZAPIClient:
             ...     "This is our group description"
             ... )
         """
-        body = build_request_body(
-            groupId=group_id,
-            description=description
-        )
+        body = {
+            "groupId": group_id,
+            "description": description,
+        }
         
         return await self.api.post("update-group-description", json=body)
     
@@ -1008,18 +1358,40 @@ class ZAPIClient:
             ...     "/path/to/photo.jpg"
             ... )
         """
-        # Handle file path
-        photo_value = photo
-        if isinstance(photo, Path) or (isinstance(photo, str) and not is_url(photo) and not is_base64(photo)):
-            photo_value = encode_base64(photo)
+        # Handle URL, base64 or file path
+        photo_value = await resolve_media(photo)
         
-        body = build_request_body(
-            groupId=group_id,
-            photo=str(photo_value)
-        )
+        body = {
+            "groupId": group_id,
+            "photo": photo_value,
+        }
         
         return await self.api.post("update-group-photo", json=body)
     
+    async def update_group_photos(
+        self,
+        group_ids: list[str],
+        photo: str | Path,
+        *,
+        concurrency: int = 20,
+    ) -> list[dict | BaseException]:
+        """
+        Set the same photo on several groups concurrently.
+        
+        The photo is resolved (and a local file encoded) only once.
+        
+        Args:
+            group_ids: Group IDs
+            photo: Photo URL, base64, or file path
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Response dict or exception for each group, in input order
+        """
+        photo_value = await resolve_media(photo)
+        bodies = [{"groupId": group_id, "photo": photo_value} for group_id in group_ids]
+        return await self._post_many("update-group-photo", bodies, concurrency)
+    
     async def leave_group(self, group_id: str) -> dict:
         """
         Leave a group.
@@ -1033,10 +1405,29 @@ class ZAPIClient:
         Example:
             >>> await client.leave_group("120363019502650977-group")
         """
-        body = build_request_body(groupId=group_id)
+        body = {"groupId": group_id}
         return await self.api.post("leave-group", json=body)
     
-    async def get_group_invite_link(self, group_id: str) -> "GroupInviteInfo":
+    async def leave_groups(
+        self,
+        group_ids: list[str],
+        *,
+        concurrency: int = 20,
+    ) -> list[dict | BaseException]:
+        """
+        Leave several groups concurrently.
+        
+        Args:
+            group_ids: Group IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Response dict or exception for each group, in input order
+        """
+        bodies = [{"groupId": group_id} for group_id in group_ids]
+        return await self._post_many("leave-group", bodies, concurrency)
+    
+    async def get_group_invite_link(self, group_id: str) -> GroupInviteInfo:
         """
         Get group invitation link.
         
@@ -1050,12 +1441,28 @@ class ZAPIClient:
             >>> invite = await client.get_group_invite_link("120363019502650977-group")
             >>> print(f"Invite link: {invite.invite_link}")
         """
-        from .types.group import GroupInviteInfo
-        
-        body = build_request_body(groupId=group_id)
+        body = {"groupId": group_id}
         data = await self.api.post("group-invite-link", json=body)
         return GroupInviteInfo.from_dict(data)
     
+    async def get_group_invite_links(
+        self,
+        group_ids: list[str],
+        *,
+        concurrency: int = 20,
+    ) -> list[GroupInviteInfo | BaseException]:
+        """
+        Get the invitation links of several groups concurrently.
+        
+        Args:
+            group_ids: Group IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            GroupInviteInfo or exception for each group, in input order
+        """
+        return await self._gather_bounded(self.get_group_invite_link, group_ids, concurrency)
+    
     async def accept_group_invite(self, invite_code: str) -> dict:
         """
         Accept group invitation.
@@ -1070,7 +1477,7 @@ class ZAPIClient:
             >>> # From link: https://chat.whatsapp.com/ABC123DEF456
             >>> await client.accept_group_invite("ABC123DEF456")
         """
-        body = build_request_body(inviteCode=invite_code)
+        body = {"inviteCode": invite_code}
         return await self.api.post("accept-group-invite", json=body)
     
     async def update_group_settings(
@@ -1089,7 +1496,7 @@ class ZAPIClient:
             only_admins_can_edit_info: Restrict editing group info to admins only
             
         Returns:
-            Response dict
+            Response dict (empty, without a request, if no setting is given)
             
         Example:
             >>> # Lock group - only admins can send
@@ -1098,14 +1505,48 @@ class ZAPIClient:
             ...     only_admins_can_send=True
             ... )
         """
-        body = build_request_body(
-            groupId=group_id,
-            onlyAdminsCanSend=only_admins_can_send,
-            onlyAdminsCanEditInfo=only_admins_can_edit_info
-        )
+        # Nothing to change: skip the round trip
+        if only_admins_can_send is None and only_admins_can_edit_info is None:
+            return {}
+        
+        body: dict[str, Any] = {"groupId": group_id}
+        if only_admins_can_send is not None:
+            body["onlyAdminsCanSend"] = only_admins_can_send
+        if only_admins_can_edit_info is not None:
+            body["onlyAdminsCanEditInfo"] = only_admins_can_edit_info
         
         return await self.api.post("update-group-settings", json=body)
     
+    async def update_groups_settings(
+        self,
+        group_ids: list[str],
+        *,
+        only_admins_can_send: bool | None = None,
+        only_admins_can_edit_info: bool | None = None,
+        concurrency: int = 20,
+    ) -> list[dict | BaseException]:
+        """
+        Apply the same settings to several groups concurrently.
+        
+        Args:
+            group_ids: Group IDs
+            only_admins_can_send: Restrict sending messages to admins only
+            only_admins_can_edit_info: Restrict editing group info to admins only
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Response dict or exception for each group, in input order
+        """
+        settings: dict[str, bool] = {}
+        if only_admins_can_send is not None:
+            settings["onlyAdminsCanSend"] = only_admins_can_send
+        if only_admins_can_edit_info is not None:
+            settings["onlyAdminsCanEditInfo"] = only_admins_can_edit_info
+        if not settings:
+            return [{} for _ in group_ids]
+        bodies = [{"groupId": group_id, **settings} for group_id in group_ids]
+        return await self._post_many("update-group-settings", bodies, concurrency)
+    
     async def get_groups(self) -> list[dict]:
         """
         Get list of all groups.
@@ -1127,6 +1568,10 @@ class ZAPIClient:
         """Close the client and cleanup resources."""
         await self.api.close()
     
+    async def aclose(self) -> None:
+        """Alias of close(), matching httpx naming."""
+        await self.close()
+    
     async def __aenter__(self):
         """Async context manager entry."""
         return self
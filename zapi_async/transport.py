@@ -0,0 +1,137 @@
+"""HTTP transport abstraction for zapi_async."""
+
+from __future__ import annotations
+import asyncio
+import json as _json
+from typing import Any, Mapping, Protocol, runtime_checkable
+
+from .errors import NetworkError
+
+
+@runtime_checkable
+class AsyncTransport(Protocol):
+    """
+    Minimal interface GraphAPI needs from an HTTP session.
+
+    ``httpx.AsyncClient`` satisfies it out of the box; other stacks can be
+    plugged in by implementing ``request`` and ``aclose``. The returned
+    response must expose ``status_code``, ``text`` and ``json()``.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        content: bytes | None = None,
+    ) -> Any:
+        ...
+
+    async def aclose(self) -> None:
+        ...
+
+
+class BufferedResponse:
+    """Fully-read HTTP response returned by non-httpx transports."""
+
+    __slots__ = ("status_code", "content")
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Response body parsed as JSON."""
+        return _json.loads(self.content)
+
+
+class AiohttpTransport:
+    """
+    Transport backed by an ``aiohttp.ClientSession``.
+
+    Useful for applications already running on aiohttp, so they can share
+    their connector (DNS cache, TLS sessions, connection pool) with Z-API.
+
+    Example:
+        >>> transport = AiohttpTransport(my_aiohttp_session)
+        >>> client = ZAPIClient(instance_id, token, session=transport)
+    """
+
+    def __init__(self, session: Any | None = None, timeout: float = 30.0):
+        """
+        Initialize the transport.
+
+        Args:
+            session: Optional existing ``aiohttp.ClientSession``. When omitted,
+                a new session is created on the first request and closed by
+                ``aclose``.
+            timeout: Total request timeout in seconds (only for owned sessions)
+        """
+        try:
+            import aiohttp  # type: ignore[import-not-found, unused-ignore]
+        except ImportError as e:
+            raise ImportError(
+                "AiohttpTransport requires aiohttp: pip install 'zapi-async[aiohttp]'"
+            ) from e
+
+        self._aiohttp = aiohttp
+        self._owns_session = session is None
+        self._timeout = timeout
+        self._session = session
+
+    def _get_session(self) -> Any:
+        """Return the session, creating the owned one on first use."""
+        if self._session is None:
+            # Created lazily: aiohttp needs a running event loop for this, and
+            # the transport may be built in synchronous setup code. Same
+            # pooling policy as GraphAPI's default httpx session, plus DNS
+            # caching so bursts don't re-resolve the API host
+            aiohttp = self._aiohttp
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=200,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300,
+                ),
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        content: bytes | None = None,
+    ) -> BufferedResponse:
+        """Send a request and read the full response body."""
+        try:
+            async with self._get_session().request(
+                method,
+                url,
+                json=json,
+                data=content,
+                params=params,
+                headers=dict(headers) if headers is not None else None,
+            ) as response:
+                return BufferedResponse(response.status, await response.read())
+        except asyncio.TimeoutError as e:
+            raise NetworkError(f"Request timeout: {e}")
+        except self._aiohttp.ClientError as e:
+            raise NetworkError(f"Network error: {e}")
+
+    async def aclose(self) -> None:
+        """Close the underlying session if it was created by this transport."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
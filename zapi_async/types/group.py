@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupCreated:
     """
     Group creation response.
@@ -26,7 +26,7 @@ class GroupCreated:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupParticipant:
     """Group participant information."""
     phone: str
@@ -43,7 +43,7 @@ class GroupParticipant:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupMetadata:
     """
     Complete group metadata.
@@ -82,12 +82,27 @@ class GroupMetadata:
     ephemeral: int | None = None
     
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> GroupMetadata:
-        """Create from API response."""
-        participants = [
-            GroupParticipant.from_dict(p)
-            for p in data.get('participants', [])
-        ]
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        *,
+        include_participants: bool = True,
+    ) -> GroupMetadata:
+        """
+        Create from API response.
+        
+        Args:
+            data: API response
+            include_participants: Build the participants list. Pass False
+                when only group info is needed, to skip per-member parsing
+                on large groups (size is still reported).
+        """
+        raw_participants = data.get('participants', [])
+        participants = (
+            [GroupParticipant.from_dict(p) for p in raw_participants]
+            if include_participants
+            else []
+        )
         
         return cls(
             group_id=data.get('id', ''),
@@ -97,7 +112,7 @@ class GroupMetadata:
             subject_owner=data.get('subjectOwner', ''),
             creation=data.get('creation', 0),
             participants=participants,
-            size=data.get('size', len(participants)),
+            size=data.get('size', len(raw_participants)),
             description=data.get('desc'),
             description_owner=data.get('descOwner'),
             description_id=data.get('descId'),
@@ -108,7 +123,7 @@ class GroupMetadata:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupInviteInfo:
     """
     Group invitation information.
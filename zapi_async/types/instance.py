@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class InstanceStatus:
     """
     Instance connection status.
@@ -29,7 +29,7 @@ class InstanceStatus:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QRCode:
     """
     QR Code for instance connection.
@@ -53,7 +53,7 @@ class QRCode:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PhoneCode:
     """
     Phone code for connection without QR code.
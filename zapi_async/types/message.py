@@ -1,18 +1,95 @@
 """Message types for received webhooks."""
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 from datetime import datetime
 
+# Keep the original payload on parsed messages (as ``_raw``). Set to False in
+# long-running consumers to avoid holding every payload in memory.
+STORE_RAW = True
 
-@dataclass
-class BaseWebhookMessage:
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings so messages share one copy of each value."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _base_kwargs(data: dict[str, Any]) -> dict[str, Any]:
+    """Extract the common BaseWebhookMessage fields from a webhook payload."""
+    # The API spells it 'momment'; only look up 'moment' when that's missing
+    moment = data.get('momment')
+    if moment is None:
+        moment = data.get('moment', 0)
+    
+    return {
+        'message_id': data.get('messageId', ''),
+        'instance_id': data.get('instanceId', ''),
+        'phone': data.get('phone', ''),
+        'from_me': data.get('fromMe', False),
+        'moment': moment,
+        'status': _intern(data.get('status', 'UNKNOWN')),
+        'type': _intern(data.get('type', 'ReceivedCallback')),
+        'chat_name': data.get('chatName'),
+        'is_group': data.get('isGroup', False),
+        'is_newsletter': data.get('isNewsletter', False),
+        'is_status_reply': data.get('isStatusReply', False),
+        'sender_name': data.get('senderName'),
+        'sender_photo': data.get('senderPhoto'),
+        'sender_lid': data.get('senderLid'),
+        'photo': data.get('photo'),
+        'participant_phone': data.get('participantPhone'),
+        'participant_lid': data.get('participantLid'),
+        'connected_phone': data.get('connectedPhone'),
+        'waiting_message': data.get('waitingMessage', False),
+        'is_edit': data.get('isEdit', False),
+        'broadcast': data.get('broadcast', False),
+        'forwarded': data.get('forwarded', False),
+        'from_api': data.get('fromApi', False),
+        'reference_message_id': data.get('referenceMessageId'),
+        'message_expiration_seconds': data.get('messageExpirationSeconds'),
+        '_raw': data if STORE_RAW else None,
+    }
+
+
+class _TimestampMixin:
+    """
+    Provides the cached ``timestamp`` property of webhook messages.
+    
+    Declared outside the dataclass so the cache slot is not a field: it stays
+    out of ``fields()``, ``asdict()``, ``repr()`` and comparisons.
+    """
+    
+    __slots__ = ("_timestamp_cache",)
+    
+    moment: int
+    # (moment it was computed from, datetime); unset until first access
+    _timestamp_cache: tuple[int, datetime]
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Convert moment (milliseconds) to datetime."""
+        try:
+            moment, timestamp = self._timestamp_cache
+        except AttributeError:
+            moment, timestamp = None, None
+        if timestamp is None or moment != self.moment:
+            timestamp = datetime.fromtimestamp(self.moment / 1000)
+            self._timestamp_cache = (self.moment, timestamp)
+        return timestamp
+
+
+@dataclass(slots=True)
+class BaseWebhookMessage(_TimestampMixin):
     """
     Base class for all webhook messages.
     
     Common fields across all message types.
     """
+    # Whether this type carries media (image, video, audio, document, sticker)
+    IS_MEDIA: ClassVar[bool] = False
+    
     # Message metadata
     message_id: str
     instance_id: str
@@ -50,48 +127,15 @@ class BaseWebhookMessage:
     reference_message_id: str | None = None  # For replies
     message_expiration_seconds: int | None = None
     
-    # Raw data for debugging
-    _raw: dict[str, Any] = field(default_factory=dict, repr=False)
-    
-    @property
-    def timestamp(self) -> datetime:
-        """Convert moment (milliseconds) to datetime."""
-        return datetime.fromtimestamp(self.moment / 1000)
+    # Raw data for debugging (None when STORE_RAW is disabled)
+    _raw: dict[str, Any] | None = field(default_factory=dict, repr=False)
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> BaseWebhookMessage:
         """Create from webhook payload."""
-        return cls(
-            message_id=data.get('messageId', ''),
-            instance_id=data.get('instanceId', ''),
-            phone=data.get('phone', ''),
-            from_me=data.get('fromMe', False),
-            moment=data.get('momment', data.get('moment', 0)),  # Note: API uses 'momment'
-            status=data.get('status', 'UNKNOWN'),
-            type=data.get('type', 'ReceivedCallback'),
-            chat_name=data.get('chatName'),
-            is_group=data.get('isGroup', False),
-            is_newsletter=data.get('isNewsletter', False),
-            is_status_reply=data.get('isStatusReply', False),
-            sender_name=data.get('senderName'),
-            sender_photo=data.get('senderPhoto'),
-            sender_lid=data.get('senderLid'),
-            photo=data.get('photo'),
-            participant_phone=data.get('participantPhone'),
-            participant_lid=data.get('participantLid'),
-            connected_phone=data.get('connectedPhone'),
-            waiting_message=data.get('waitingMessage', False),
-            is_edit=data.get('isEdit', False),
-            broadcast=data.get('broadcast', False),
-            forwarded=data.get('forwarded', False),
-            from_api=data.get('fromApi', False),
-            reference_message_id=data.get('referenceMessageId'),
-            message_expiration_seconds=data.get('messageExpirationSeconds'),
-            _raw=data,
-        )
-
+        return cls(**_base_kwargs(data))
 
-@dataclass
+@dataclass(slots=True)
 class TextMessage(BaseWebhookMessage):
     """Text message received via webhook."""
     
@@ -104,24 +148,24 @@ class TextMessage(BaseWebhookMessage):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TextMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         text_data = data.get('text', {})
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             message=text_data.get('message', ''),
             description=text_data.get('description') or text_data.get('descritpion'),  # API typo
             title=text_data.get('title'),
             url=text_data.get('url'),
             thumbnail_url=text_data.get('thumbnailUrl'),
-            _raw=data,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageMessage(BaseWebhookMessage):
     """Image message received via webhook."""
     
+    IS_MEDIA: ClassVar[bool] = True
+    
     image_url: str = ""
     thumbnail_url: str | None = None
     caption: str | None = None
@@ -133,26 +177,26 @@ class ImageMessage(BaseWebhookMessage):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ImageMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         image_data = data.get('image', {})
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             image_url=image_data.get('imageUrl', ''),
             thumbnail_url=image_data.get('thumbnailUrl'),
             caption=image_data.get('caption'),
-            mime_type=image_data.get('mimeType'),
+            mime_type=_intern(image_data.get('mimeType')),
             width=image_data.get('width'),
             height=image_data.get('height'),
             view_once=image_data.get('viewOnce', False),
-            _raw=data,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoMessage(BaseWebhookMessage):
     """Video message received via webhook."""
     
+    IS_MEDIA: ClassVar[bool] = True
+    
     video_url: str = ""
     caption: str | None = None
     mime_type: str | None = None
@@ -162,24 +206,24 @@ class VideoMessage(BaseWebhookMessage):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> VideoMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         video_data = data.get('video', {})
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             video_url=video_data.get('videoUrl', ''),
             caption=video_data.get('caption'),
-            mime_type=video_data.get('mimeType'),
+            mime_type=_intern(video_data.get('mimeType')),
             seconds=video_data.get('seconds'),
             view_once=video_data.get('viewOnce', False),
-            _raw=data,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioMessage(BaseWebhookMessage):
     """Audio message received via webhook."""
     
+    IS_MEDIA: ClassVar[bool] = True
+    
     audio_url: str = ""
     mime_type: str | None = None
     seconds: int | None = None
@@ -189,24 +233,24 @@ class AudioMessage(BaseWebhookMessage):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AudioMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         audio_data = data.get('audio', {})
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             audio_url=audio_data.get('audioUrl', ''),
-            mime_type=audio_data.get('mimeType'),
+            mime_type=_intern(audio_data.get('mimeType')),
             seconds=audio_data.get('seconds'),
             ptt=audio_data.get('ptt', False),
             view_once=audio_data.get('viewOnce', False),
-            _raw=data,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMessage(BaseWebhookMessage):
     """Document message received via webhook."""
     
+    IS_MEDIA: ClassVar[bool] = True
+    
     document_url: str = ""
     file_name: str | None = None
     title: str | None = None
@@ -217,43 +261,41 @@ class DocumentMessage(BaseWebhookMessage):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> DocumentMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         doc_data = data.get('document', {})
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             document_url=doc_data.get('documentUrl', ''),
             file_name=doc_data.get('fileName'),
             title=doc_data.get('title'),
             page_count=doc_data.get('pageCount'),
-            mime_type=doc_data.get('mimeType'),
+            mime_type=_intern(doc_data.get('mimeType')),
             thumbnail_url=doc_data.get('thumbnailUrl'),
-            _raw=data,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StickerMessage(BaseWebhookMessage):
     """Sticker message received via webhook."""
     
+    IS_MEDIA: ClassVar[bool] = True
+    
     sticker_url: str = ""
     mime_type: str | None = None
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> StickerMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         sticker_data = data.get('sticker', {})
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             sticker_url=sticker_data.get('stickerUrl', ''),
-            mime_type=sticker_data.get('mimeType'),
-            _raw=data,
+            mime_type=_intern(sticker_data.get('mimeType')),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationMessage(BaseWebhookMessage):
     """Location message received via webhook."""
     
@@ -267,22 +309,20 @@ class LocationMessage(BaseWebhookMessage):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> LocationMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         loc_data = data.get('location', {})
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             latitude=loc_data.get('latitude', 0.0),
             longitude=loc_data.get('longitude', 0.0),
             name=loc_data.get('name'),
             address=loc_data.get('address'),
             url=loc_data.get('url'),
             thumbnail_url=loc_data.get('thumbnailUrl'),
-            _raw=data,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactMessage(BaseWebhookMessage):
     """Contact message received via webhook."""
     
@@ -292,18 +332,16 @@ class ContactMessage(BaseWebhookMessage):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ContactMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         contact_data = data.get('contact', {})
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             display_name=contact_data.get('displayName', ''),
             vcard=contact_data.get('vCard', ''),
-            _raw=data,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ReferencedMessage:
     """Referenced message info (for reactions)."""
     message_id: str
@@ -312,7 +350,7 @@ class ReferencedMessage:
     participant: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReactionMessage(BaseWebhookMessage):
     """Reaction message received via webhook."""
     
@@ -324,7 +362,6 @@ class ReactionMessage(BaseWebhookMessage):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ReactionMessage:
         """Create from webhook payload."""
-        base = BaseWebhookMessage.from_dict(data)
         reaction_data = data.get('reaction', {})
         
         ref_msg = None
@@ -337,12 +374,11 @@ class ReactionMessage(BaseWebhookMessage):
             )
         
         return cls(
-            **{k: v for k, v in base.__dict__.items() if not k.startswith('_')},
+            **_base_kwargs(data),
             emoji=reaction_data.get('value', ''),
             reaction_time=reaction_data.get('time', 0),
             reaction_by=reaction_data.get('reactionBy', ''),
             referenced_message=ref_msg,
-            _raw=data,
         )
 
 
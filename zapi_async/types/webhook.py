@@ -1,7 +1,14 @@
 """Webhook payload parsing and handling."""
 
 from __future__ import annotations
-from typing import Any
+import json
+from typing import Any, Callable
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 from .message import (
     BaseWebhookMessage,
     TextMessage,
@@ -17,7 +24,24 @@ from .message import (
 )
 
 
-def parse_webhook_message(payload: dict[str, Any]) -> WebhookMessage:
+# Payload data field -> message parser, in detection priority order. The
+# bound from_dict methods are resolved once here rather than per message.
+_DISPATCH: dict[str, Callable[[dict[str, Any]], WebhookMessage]] = {
+    'reaction': ReactionMessage.from_dict,
+    'text': TextMessage.from_dict,
+    'image': ImageMessage.from_dict,
+    'video': VideoMessage.from_dict,
+    'audio': AudioMessage.from_dict,
+    'document': DocumentMessage.from_dict,
+    'sticker': StickerMessage.from_dict,
+    'location': LocationMessage.from_dict,
+    'contact': ContactMessage.from_dict,
+}
+
+
+def parse_webhook_message(
+    payload: dict[str, Any] | bytes | bytearray | str,
+) -> WebhookMessage:
     """
     Parse webhook payload into appropriate message type.
     
@@ -25,7 +49,9 @@ def parse_webhook_message(payload: dict[str, Any]) -> WebhookMessage:
     and returns the correct typed message object.
     
     Args:
-        payload: Raw webhook JSON payload
+        payload: Webhook JSON payload, either already decoded or as the raw
+            request body (bytes/bytearray/str), which is decoded with orjson when
+            available
         
     Returns:
         Typed message object (TextMessage, ImageMessage, etc.)
@@ -43,37 +69,20 @@ def parse_webhook_message(payload: dict[str, Any]) -> WebhookMessage:
         >>> msg.message
         'Hello!'
     """
-    # Check for specific message types by presence of data fields
-    
-    if 'reaction' in payload:
-        return ReactionMessage.from_dict(payload)
-    
-    if 'text' in payload:
-        return TextMessage.from_dict(payload)
-    
-    if 'image' in payload:
-        return ImageMessage.from_dict(payload)
-    
-    if 'video' in payload:
-        return VideoMessage.from_dict(payload)
-    
-    if 'audio' in payload:
-        return AudioMessage.from_dict(payload)
-    
-    if 'document' in payload:
-        return DocumentMessage.from_dict(payload)
-    
-    if 'sticker' in payload:
-        return StickerMessage.from_dict(payload)
-    
-    if 'location' in payload:
-        return LocationMessage.from_dict(payload)
+    if isinstance(payload, (bytes, bytearray, str)):
+        data: dict[str, Any] = (
+            orjson.loads(payload) if orjson is not None else json.loads(payload)
+        )
+    else:
+        data = payload
     
-    if 'contact' in payload:
-        return ContactMessage.from_dict(payload)
+    # Detect the message type by presence of its data field
+    for key, from_dict in _DISPATCH.items():
+        if key in data:
+            return from_dict(data)
     
     # Fallback to base message
-    return BaseWebhookMessage.from_dict(payload)
+    return BaseWebhookMessage.from_dict(data)
 
 
 def is_text_message(msg: WebhookMessage) -> bool:
@@ -83,7 +92,7 @@ def is_text_message(msg: WebhookMessage) -> bool:
 
 def is_media_message(msg: WebhookMessage) -> bool:
     """Check if message is a media message (image, video, audio, document, sticker)."""
-    return isinstance(msg, (ImageMessage, VideoMessage, AudioMessage, DocumentMessage, StickerMessage))
+    return msg.IS_MEDIA
 
 
 def is_image_message(msg: WebhookMessage) -> bool: